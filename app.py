@@ -12,6 +12,8 @@ import plotly.graph_objects as go
 from src.simulation_engine import BioleachingReactor, ElectroRecovery
 from src.ai_engine import HyperspectralClassifier
 from src.financials import FinancialModel
+from src.dcf import DiscountedCashFlow
+from src.plant_pipeline import PlantEconomicsPipeline
 from src.connect_agent import ConnectAgent
 from src.ui_config import MAIN_CSS, SIDEBAR_LOGO, SIDEBAR_FOOTER
 
@@ -48,8 +50,16 @@ reactor = BioleachingReactor()
 extractor = ElectroRecovery()
 ai_classifier = HyperspectralClassifier()
 finance = FinancialModel()
+project_dcf = DiscountedCashFlow()
 connector = ConnectAgent()
 
+
+@st.cache_resource
+def get_economics_pipeline():
+    """One memoized plant-economics pipeline shared across Streamlit reruns."""
+    return PlantEconomicsPipeline(reactor, finance, project_dcf)
+
+
 # Diagnostic response generation function
 
 
@@ -664,13 +674,12 @@ elif page == "Financial Analysis":
 
     annual_cap = st.slider("Annual Capacity (Tons)", 100, 20000, 5000)
 
-    # Calc
+    # Calc: 350 kg black mass per ton input; only stages downstream of a
+    # changed input are recomputed on rerun
     BM_CALC = 350.0  # kg
-    # Need to normalize mass balance to 1 ton for financial calc
-    m_bal_f, _ = reactor.mass_balance(BM_CALC)
-    p_dict_f = extractor.calculate_products(m_bal_f)
-
-    f_res = finance.calculate_roi(annual_cap, p_dict_f)
+    economics = get_economics_pipeline()
+    econ_res = economics.run(annual_cap, black_mass_kg=BM_CALC)
+    f_res = econ_res['ROI']
 
     # KPI Row
     k_f1, k_f2, k_f3, k_f4 = st.columns(4)
@@ -692,8 +701,30 @@ elif page == "Financial Analysis":
     fig_rev.update_layout(template="plotly_dark")
     st.plotly_chart(fig_rev)
 
-    st.success(
-        "Analysis confirms Startup Viability with >25% Internal Rate of Return (IRR).")
+    # Multi-year DCF: ramp-up, degradation, depreciation and tax
+    dcf_res = econ_res['DCF']
+    plant_life = project_dcf.assumptions['plant_life_years']
+    irr_pct = float(dcf_res['IRR']) * 100
+    st.markdown(f"### {plant_life}-Year Discounted Cash Flow")
+    fig_dcf = px.bar(
+        x=project_dcf.years, y=np.asarray(dcf_res['Cash_Flows']) / 1e7,
+        labels={'x': 'Year', 'y': 'After-Tax Cash Flow (₹ Cr)'}
+    )
+    fig_dcf.update_layout(template="plotly_dark")
+    st.plotly_chart(fig_dcf)
+
+    if irr_pct > 25:
+        st.success(
+            f"Analysis confirms Startup Viability: IRR {irr_pct:.0f}%, "
+            f"NPV ₹ {float(dcf_res['NPV'])/1e7:.1f} Cr at "
+            f"{project_dcf.assumptions['discount_rate']*100:.0f}% discount rate.")
+    else:
+        st.warning(
+            f"IRR {irr_pct:.0f}% is below the 25% viability hurdle at this capacity.")
+
+    cache_stats = economics.cache_info()
+    st.caption("Pipeline cache (hits/misses): " + ", ".join(
+        f"{stage} {stats['hits']}/{stats['misses']}" for stage, stats in cache_stats.items()))
 
 elif page == "Carbon Credits & ESG":
     st.title("Carbon Credits & ESG Impact Monetization")
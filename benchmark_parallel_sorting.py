@@ -0,0 +1,63 @@
+"""
+RADORDENA-SORT-01 Multi-Core Scaling Benchmark.
+Measures objects/sec of SharedMemorySorter from 1 worker up to every available
+core on synthetic conveyor frames, against the single-process classify_batch.
+
+Usage: python benchmark_parallel_sorting.py [n_objects] [repeats]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from src.ai_engine import HyperspectralClassifier
+from src.parallel_sorting import SharedMemorySorter
+
+
+def best_time(func, repeats):
+    """Best wall-clock time of func() over several repeats."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark(n_objects=500_000, repeats=5, max_workers=None):
+    """
+    Returns: list of (workers, seconds, objects_per_sec, speedup) rows.
+    Row 0 is the in-process baseline (workers=0).
+    """
+    classifier = HyperspectralClassifier()
+    spectra, _ = classifier.generate_synthetic_batch(
+        ['NMC', 'LFP', 'Plastic'], n_objects, rng=np.random.default_rng(42),
+        p=[0.45, 0.45, 0.10])
+
+    baseline = best_time(lambda: classifier.classify_batch(spectra), repeats)
+    rows = [(0, baseline, n_objects / baseline, 1.0)]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    worker_counts = sorted({1, *[2 ** i for i in range(1, 8) if 2 ** i < max_workers],
+                            max_workers})
+
+    for workers in worker_counts:
+        with SharedMemorySorter(n_workers=workers, capacity=n_objects) as sorter:
+            sorter.frame(n_objects)[:] = spectra  # Camera writes straight into shared memory
+            sorter.classify_frame(n_objects)  # Warm up workers and attachments
+            elapsed = best_time(lambda s=sorter: s.classify_frame(n_objects), repeats)
+        rows.append((workers, elapsed, n_objects / elapsed, baseline / elapsed))
+
+    return rows
+
+
+if __name__ == "__main__":
+    N_OBJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"Scaling benchmark: {N_OBJECTS:,} objects, best of {REPEATS}")
+    print(f"{'Workers':>8} {'Time (ms)':>10} {'Objects/s':>14} {'Speedup':>8}")
+    for n_workers, seconds, throughput, speedup in run_benchmark(N_OBJECTS, REPEATS):
+        label = "inline" if n_workers == 0 else str(n_workers)
+        print(f"{label:>8} {seconds*1e3:>10.2f} {throughput:>14,.0f} {speedup:>7.2f}x")
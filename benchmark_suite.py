@@ -0,0 +1,193 @@
+"""
+RADORDENA-SORT-01 Throughput & Latency Benchmark Suite.
+Times spectra generation, classification, anomaly screening and end-to-end
+conveyor routing at several batch sizes, reporting objects/sec and p50/p99
+per-call latency. Results are written as JSON so runs can be compared across
+commits to catch regressions.
+
+Usage:
+    python benchmark_suite.py --output bench_results.json
+    python benchmark_suite.py --compare bench_results.json --output bench_new.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from src.ai_engine import HyperspectralClassifier
+from src.sorting_stream import ConveyorSortingEngine
+
+DEFAULT_BATCH_SIZES = (1, 64, 1024, 16384)
+FEED_MIX = (['NMC', 'LFP', 'Plastic'], [0.45, 0.45, 0.10])
+
+
+def git_revision():
+    """Short commit hash of the working tree, or 'unknown' outside git."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def time_calls(func, batch_size, min_calls=20, min_seconds=0.5):
+    """
+    Calls func() repeatedly (after one warm-up call) until both limits are met.
+    Returns: dict with objects/sec and p50/p99 latency of a single call.
+    """
+    func()
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < min_calls or time.perf_counter() - started < min_seconds:
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    timings = np.asarray(timings)
+    return {
+        'calls': len(timings),
+        'objects_per_sec': batch_size * len(timings) / timings.sum(),
+        'p50_ms': float(np.percentile(timings, 50) * 1e3),
+        'p99_ms': float(np.percentile(timings, 99) * 1e3),
+    }
+
+
+def build_cases(classifier, batch_size, rng):
+    """Benchmark name -> zero-argument callable processing batch_size objects."""
+    chemistries, mix = FEED_MIX
+    spectra, labels = classifier.generate_synthetic_batch(chemistries, batch_size, rng, p=mix)
+
+    def generate_scalar():
+        for chemistry in labels:
+            classifier.generate_synthetic_spectra(chemistry)
+
+    def classify_scalar():
+        for spectrum in spectra:
+            classifier.classify_sample(spectrum)
+
+    def anomaly_scalar():
+        for spectrum in spectra:
+            classifier.detect_anomaly(spectrum)
+
+    def route_end_to_end():
+        engine = ConveyorSortingEngine(classifier, capacity=max(batch_size, 1),
+                                       batch_size=batch_size, max_latency_s=1.0)
+        for batch in engine.run([spectra]):
+            classifier.screen_anomalies(spectra[batch.object_ids])
+
+    return {
+        'generate.scalar': generate_scalar,
+        'generate.batch': lambda: classifier.generate_synthetic_batch(
+            chemistries, batch_size, rng, p=mix),
+        'classify.scalar': classify_scalar,
+        'classify.batch': lambda: classifier.classify_batch(spectra),
+        'anomaly.scalar': anomaly_scalar,
+        'anomaly.batch': lambda: classifier.screen_anomalies(spectra),
+        'route.end_to_end': route_end_to_end,
+    }
+
+
+def run_suite(batch_sizes=DEFAULT_BATCH_SIZES, max_scalar_batch=1024, min_seconds=0.5, seed=0):
+    """
+    Runs every benchmark at every batch size. Scalar (per-object) paths are
+    skipped above max_scalar_batch to keep the run short.
+    Returns: JSON-serialisable results document.
+    """
+    classifier = HyperspectralClassifier()
+    rng = np.random.default_rng(seed)
+    results = []
+
+    for batch_size in batch_sizes:
+        for name, func in build_cases(classifier, batch_size, rng).items():
+            if name.endswith('.scalar') and batch_size > max_scalar_batch:
+                continue
+            row = {'benchmark': name, 'batch_size': batch_size}
+            row.update(time_calls(func, batch_size, min_seconds=min_seconds))
+            results.append(row)
+
+    return {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """
+    Matches rows on (benchmark, batch_size) and flags throughput drops larger
+    than tolerance (fraction). Returns: list of regression description strings.
+    """
+    previous = {(r['benchmark'], r['batch_size']): r for r in baseline['results']}
+    regressions = []
+    for row in current['results']:
+        old = previous.get((row['benchmark'], row['batch_size']))
+        if old is None:
+            continue
+        change = row['objects_per_sec'] / old['objects_per_sec'] - 1.0
+        if change < -tolerance:
+            regressions.append(f"{row['benchmark']} @ {row['batch_size']}: "
+                               f"{old['objects_per_sec']:,.0f} -> "
+                               f"{row['objects_per_sec']:,.0f} obj/s ({change*100:+.1f}%)")
+    return regressions
+
+
+def print_table(document):
+    """Human-readable summary of a results document."""
+    print(f"Revision {document['meta']['revision']} | numpy {document['meta']['numpy']}")
+    print(f"{'Benchmark':<18} {'Batch':>7} {'Objects/s':>14} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for row in document['results']:
+        print(f"{row['benchmark']:<18} {row['batch_size']:>7} {row['objects_per_sec']:>14,.0f} "
+              f"{row['p50_ms']:>10.3f} {row['p99_ms']:>10.3f}")
+
+
+def main(argv=None):
+    """CLI entry point; returns the process exit code (1 on regression)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--min-seconds", type=float, default=0.5,
+                        help="Minimum timing window per benchmark")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier commit")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed throughput drop before flagging a regression")
+    args = parser.parse_args(argv)
+
+    # Read the baseline before anything is written, and never overwrite it
+    baseline = None
+    if args.compare:
+        if os.path.abspath(args.compare) == os.path.abspath(args.output):
+            parser.error("--output must differ from --compare (it would overwrite the baseline)")
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+    document = run_suite(args.batch_sizes, min_seconds=args.min_seconds)
+    print_table(document)
+
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(document, baseline, args.tolerance)
+        if regressions:
+            print(f"\nREGRESSIONS vs {baseline['meta']['revision']}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions vs {baseline['meta']['revision']} "
+              f"(tolerance {args.tolerance*100:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
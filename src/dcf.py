@@ -0,0 +1,154 @@
+"""
+Discounted Cash Flow module for InnoSortRecycle Digital Twin.
+This module projects annual plant cash flows over the project life (capacity
+ramp-up, recovery degradation, depreciation and tax) and solves NPV and IRR
+for thousands of scenarios at once, one row of a cash-flow matrix each.
+"""
+import numpy as np
+
+# Money in INR, time in years. CapEx is per ton/year of nameplate capacity.
+DEFAULT_DCF_ASSUMPTIONS = {
+    'plant_life_years': 15,
+    'capex_inr_per_tpa': 100000.0,  # Sorting line + reactors + electro-recovery
+    'ramp_up': (0.5, 0.8),          # Utilisation in the first operating years, then 100%
+    'degradation': 0.01,            # Annual loss of recovery / revenue
+    'tax_rate': 0.25,               # Indian corporate tax (new regime, incl. surcharge)
+    'depreciation_years': 10,       # Straight-line
+    'discount_rate': 0.12,
+}
+
+IRR_BRACKET = (-0.99, 100.0)
+
+
+def npv(cash_flows, rate):
+    """
+    Net present value of (..., Y+1) cash flows (year 0 first) at rate(s)
+    broadcast against the leading axes.
+    """
+    cash_flows = np.asarray(cash_flows, dtype=np.float64)
+    years = np.arange(cash_flows.shape[-1])
+    rate = np.asarray(rate, dtype=np.float64)[..., np.newaxis]
+    return (cash_flows * (1.0 + rate) ** -years).sum(axis=-1)
+
+
+def irr(cash_flows, guess=0.1, tol=1e-10, max_iter=50, bisection_iter=200):
+    """
+    Internal rate of return of every row of (..., Y+1) cash flows.
+    Newton iterations run on all rows together; rows that diverge, leave
+    IRR_BRACKET or do not converge fall back to bisection on the bracket.
+
+    Returns:
+        np.ndarray: IRR per row; NaN where NPV does not change sign in the bracket.
+    """
+    cash_flows = np.asarray(cash_flows, dtype=np.float64)
+    years = np.arange(cash_flows.shape[-1])
+    rate = np.full(cash_flows.shape[:-1], float(guess))
+    converged = np.zeros(rate.shape, dtype=bool)
+
+    with np.errstate(all='ignore'):
+        for _ in range(max_iter):
+            discount = (1.0 + rate[..., np.newaxis]) ** -years
+            value = (cash_flows * discount).sum(axis=-1)
+            slope = -(years * cash_flows * discount).sum(axis=-1) / (1.0 + rate)
+            step = value / slope
+            rate = np.where(converged, rate, rate - step)
+            converged |= np.abs(step) < tol * (1.0 + np.abs(rate))
+            if converged.all():
+                break
+
+    lo, hi = IRR_BRACKET
+    failed = ~converged | ~np.isfinite(rate) | (rate <= lo) | (rate >= hi)
+    if failed.any():
+        rate[failed] = _bisect_irr(cash_flows[failed], lo, hi, bisection_iter)
+    return rate
+
+
+def _bisect_irr(cash_flows, lo, hi, n_iter):
+    """Vectorized bisection of NPV(rate) = 0 on [lo, hi] for each row."""
+    low = np.full(len(cash_flows), lo)
+    high = np.full(len(cash_flows), hi)
+    value_low = npv(cash_flows, low)
+    bracketed = np.sign(value_low) != np.sign(npv(cash_flows, high))
+    for _ in range(n_iter):
+        middle = 0.5 * (low + high)
+        value_mid = npv(cash_flows, middle)
+        same_side = np.sign(value_mid) == np.sign(value_low)
+        low = np.where(same_side, middle, low)
+        value_low = np.where(same_side, value_mid, value_low)
+        high = np.where(same_side, high, middle)
+    return np.where(bracketed, 0.5 * (low + high), np.nan)
+
+
+class DiscountedCashFlow:
+    """
+    Multi-year project model on top of FinancialModel's steady-state year.
+    Revenue and OpEx scale with utilisation (ramp-up, then nameplate); revenue
+    additionally degrades each year. Losses are not carried forward.
+    """
+
+    def __init__(self, **assumptions):
+        unknown = set(assumptions) - set(DEFAULT_DCF_ASSUMPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown DCF assumptions: {sorted(unknown)}")
+        self.assumptions = dict(DEFAULT_DCF_ASSUMPTIONS, **assumptions)
+
+        a = self.assumptions
+        life = int(a['plant_life_years'])
+        self.years = np.arange(life + 1)
+        utilisation = np.ones(life)
+        ramp_up = np.asarray(a['ramp_up'], dtype=np.float64)[:life]
+        utilisation[:len(ramp_up)] = ramp_up
+        self.utilisation = utilisation
+        self.revenue_factor = utilisation * (1.0 - a['degradation']) ** np.arange(life)
+
+    def cash_flows(self, annual_revenue, annual_opex, capex):
+        """
+        (..., Y+1) after-tax cash flows; year 0 is the CapEx outlay.
+        annual_revenue / annual_opex are nameplate-year values (e.g. from
+        FinancialModel.calculate_roi_grid), broadcast against capex.
+        """
+        a = self.assumptions
+        revenue, opex, capex = np.broadcast_arrays(
+            *[np.asarray(v, dtype=np.float64)[..., np.newaxis]
+              for v in (annual_revenue, annual_opex, capex)])
+        ebitda = revenue * self.revenue_factor - opex * self.utilisation
+
+        operating_years = np.arange(1, len(self.years))
+        depreciation = np.where(operating_years <= a['depreciation_years'],
+                                capex / a['depreciation_years'], 0.0)
+        tax = a['tax_rate'] * np.maximum(ebitda - depreciation, 0.0)
+        return np.concatenate([-capex, ebitda - tax], axis=-1)
+
+    def evaluate(self, annual_revenue, annual_opex, capex, discount_rate=None):
+        """
+        NPV, IRR and simple payback for every scenario.
+
+        Returns:
+            dict: 'NPV', 'IRR', 'Payback_Years' arrays of the broadcast scenario
+                shape and the 'Cash_Flows' matrix.
+        """
+        rate = self.assumptions['discount_rate'] if discount_rate is None else discount_rate
+        flows = self.cash_flows(annual_revenue, annual_opex, capex)
+
+        # Payback: first year cumulative cash turns non-negative, interpolated within it
+        cumulative = np.cumsum(flows, axis=-1)
+        recovered = cumulative >= 0
+        year = np.argmax(recovered, axis=-1)
+        previous = np.maximum(year - 1, 0)[..., np.newaxis]
+        before = np.take_along_axis(cumulative, previous, axis=-1)[..., 0]
+        inflow = np.take_along_axis(flows, year[..., np.newaxis], axis=-1)[..., 0]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            payback = np.where(year == 0, 0.0, year - 1 - before / inflow)
+        payback = np.where(recovered.any(axis=-1), payback, np.inf)
+
+        return {
+            'NPV': npv(flows, rate),
+            'IRR': irr(flows),
+            'Payback_Years': payback,
+            'Cash_Flows': flows,
+        }
+
+    def evaluate_roi(self, roi, tonnages, discount_rate=None):
+        """evaluate() for a calculate_roi / calculate_roi_grid result at the given capacities."""
+        capex = self.assumptions['capex_inr_per_tpa'] * np.asarray(tonnages, dtype=np.float64)
+        return self.evaluate(roi['Annual_Revenue'], roi['Annual_OpEx'], capex, discount_rate)
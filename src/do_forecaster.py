@@ -0,0 +1,166 @@
+"""
+DO Forecaster module for InnoSortRecycle Digital Twin.
+This module projects dissolved oxygen in RADORDENA-BIO-01 tanks over the
+predictive-control horizon from recent DO and bacterial-load telemetry. All
+tanks are forecast in one vectorized call; reasoning text is only built for
+the tanks an operator asks about.
+"""
+import numpy as np
+
+PREDICTION_HORIZON_MIN = 20
+BOOST_ACTION = "INCREASE AERATION (Pre-emptive)"
+HOLD_ACTION = "Maintain Flow"
+
+# Time unit is minutes. kla and do_sat match the kinetics defaults
+# (480 1/day, 7.5 mg/L at 30 C); the specific uptake puts the steady-state DO
+# of a 1e8 cells/mL culture at ~2.5 mg/L, the marginally stable regime.
+DEFAULT_FORECAST_PARAMS = {
+    'kla': 480.0 / 1440.0,      # Oxygen transfer coefficient (1/min)
+    'do_sat': 7.5,              # DO saturation (mg/L)
+    'o2_uptake': 5.0e-8 / 3.0,  # Specific O2 uptake (mg/L/min per cell/mL)
+    'do_critical': 1.0,         # DO below which the culture is starved (mg/L)
+}
+
+
+def _log_growth_rate(bacteria, sample_interval_min):
+    """Least-squares slope of ln(bacteria) per minute along the last axis, floored at 0."""
+    n_samples = bacteria.shape[-1]
+    if n_samples < 2:
+        return np.zeros(bacteria.shape[:-1])
+    t = (np.arange(n_samples) - (n_samples - 1) / 2.0) * sample_interval_min
+    log_load = np.log(np.maximum(bacteria, 1.0))
+    slope = (log_load @ t) / (t @ t)
+    return np.maximum(slope, 0.0)
+
+
+class DOForecast:
+    """
+    Batch result of DOCrashForecaster.forecast.
+    time_to_crash_min (inf when DO stays above critical over the horizon) and
+    boost are plain arrays for the aeration controller; text is only produced
+    when reasoning() or explain() is called.
+    """
+
+    def __init__(self, times_min, projected_do, time_to_crash_min, current_do,
+                 bacteria, growth_rate):
+        self.times_min = times_min
+        self.projected_do = projected_do
+        self.time_to_crash_min = time_to_crash_min
+        self.boost = np.isfinite(time_to_crash_min)
+        self.current_do = current_do
+        self.bacteria = bacteria
+        self.growth_rate = growth_rate
+
+    def __len__(self):
+        return len(self.boost)
+
+    @property
+    def flagged(self):
+        """Indices of tanks that need a pre-emptive aeration boost."""
+        return np.flatnonzero(self.boost)
+
+    @property
+    def actions(self):
+        """Decision label per tank."""
+        return np.where(self.boost, BOOST_ACTION, HOLD_ACTION)
+
+    def reasoning(self, index):
+        """(reasoning, action) for one tank, in the predictive_control format."""
+        horizon = int(self.times_min[-1])
+        load = self.bacteria[index]
+        current_do = self.current_do[index]
+        if self.growth_rate[index] > 0:
+            growth = f"doubling every {np.log(2.0) / self.growth_rate[index]:.0f} min"
+        else:
+            growth = "stationary phase"
+        if self.boost[index]:
+            reasoning = [
+                f"State: Bacterial load {load:.0e} cells/mL, {growth}.",
+                f"Trend: DO at {current_do:.2f} mg/L, projected "
+                f"{self.projected_do[index, -1]:.2f} mg/L at T+{horizon}m.",
+                f"Prediction (T+{self.time_to_crash_min[index]:.1f}m): Oxygen Crash imminent "
+                "due to exponential consumption.",
+                "Strategy: Pre-emptive Aeration Boost required to maintain homeostasis."
+            ]
+            return reasoning, BOOST_ACTION
+        reasoning = [
+            f"State: Bacterial load {load:.0e} cells/mL, consumption stable.",
+            f"Prediction (T+{horizon}m): DO levels remain within safe bounds "
+            f"(min {self.projected_do[index].min():.2f} mg/L).",
+            "Strategy: Maintain current energy efficiency."
+        ]
+        return reasoning, HOLD_ACTION
+
+    def explain(self):
+        """Reasoning for the flagged tanks only: {index: (reasoning, action)}."""
+        return {int(i): self.reasoning(i) for i in self.flagged}
+
+
+class DOCrashForecaster:
+    """
+    RADORDENA-CORE Capability: Predictive DO control for a whole fleet.
+    Each tank's DO follows dDO/dt = kla (do_sat - DO) - o2_uptake X(t), with the
+    bacterial load X(t) = X_now exp(mu t) and mu fitted to the recent bacteria
+    series, which has the closed-form solution used for the projection.
+    """
+
+    def __init__(self, horizon_min=PREDICTION_HORIZON_MIN, resolution_min=0.5, **params):
+        unknown = set(params) - set(DEFAULT_FORECAST_PARAMS)
+        if unknown:
+            raise ValueError(f"Unknown forecast parameters: {sorted(unknown)}")
+        self.params = dict(DEFAULT_FORECAST_PARAMS, **params)
+        n_points = int(np.ceil(horizon_min / resolution_min)) + 1
+        self.times_min = np.linspace(0.0, horizon_min, n_points)
+
+    def project(self, current_do, bacteria, growth_rate):
+        """(N, H) projected DO at self.times_min (unclipped; negative means depleted)."""
+        p = self.params
+        t = self.times_min
+        do0 = np.asarray(current_do, dtype=np.float64)[..., np.newaxis]
+        uptake = p['o2_uptake'] * np.asarray(bacteria, dtype=np.float64)[..., np.newaxis]
+        mu = np.asarray(growth_rate, dtype=np.float64)[..., np.newaxis]
+        relaxation = np.exp(-p['kla'] * t)
+        projected = (p['do_sat'] + (do0 - p['do_sat']) * relaxation
+                     - uptake * (np.exp(mu * t) - relaxation) / (mu + p['kla']))
+        return projected
+
+    def forecast(self, do_series, bacteria_series, sample_interval_min=1.0):
+        """
+        Forecasts every tank over the horizon.
+
+        Args:
+            do_series (array-like): (N, T) DO readings (mg/L), oldest first;
+                a (T,) series is treated as one tank.
+            bacteria_series (array-like): (N, T) bacterial load (cells/mL).
+            sample_interval_min (float): Minutes between readings.
+
+        Returns:
+            DOForecast: Projection, time to crash (linearly interpolated) and
+                aeration-boost flags per tank.
+        """
+        do_series = np.atleast_2d(np.asarray(do_series, dtype=np.float64))
+        bacteria_series = np.atleast_2d(np.asarray(bacteria_series, dtype=np.float64))
+        if do_series.shape != bacteria_series.shape:
+            raise ValueError(f"DO series {do_series.shape} and bacteria series "
+                             f"{bacteria_series.shape} must have the same shape")
+
+        current_do = do_series[:, -1]
+        bacteria = bacteria_series[:, -1]
+        growth_rate = _log_growth_rate(bacteria_series, sample_interval_min)
+        projected = self.project(current_do, bacteria, growth_rate)
+
+        # First projected point at or below the critical level
+        below = projected <= self.params['do_critical']
+        crashes = below.any(axis=1)
+        first = np.argmax(below, axis=1)
+        previous = np.maximum(first - 1, 0)
+        rows = np.arange(len(first))
+        do_before, do_after = projected[rows, previous], projected[rows, first]
+        drop = np.where(do_before > do_after, do_before - do_after, 1.0)
+        fraction = np.clip((do_before - self.params['do_critical']) / drop, 0.0, 1.0)
+        t = self.times_min
+        time_to_crash = t[previous] + fraction * (t[first] - t[previous])
+        time_to_crash = np.where(crashes, time_to_crash, np.inf)
+
+        return DOForecast(t, np.maximum(projected, 0.0), time_to_crash, current_do, bacteria,
+                          growth_rate)
@@ -2,6 +2,7 @@
 Financial Modeling module for InnoSortRecycle Digital Twin.
 This module handles the unit economics, ROI calculations, and revenue breakdown.
 """
+import numpy as np
 
 
 class FinancialModel:
@@ -30,6 +31,7 @@ class FinancialModel:
             'MnCO3': 2000
         }
         self.exchange_rate = 84.0  # USD to INR
+        self.products = tuple(self.market_prices_usd)
 
     def calculate_roi(self, tonnage_per_year, recovered_products_kg):
         """
@@ -77,3 +79,93 @@ class FinancialModel:
             'Payback_Years': payback_period,
             'Revenue_Breakdown': revenue_breakdown
         }
+
+    def price_vector(self, price_scenarios=None):
+        """
+        (..., n_products) USD/ton prices in self.products order.
+        price_scenarios may be an array in that order or a dict of product ->
+        scalar/array (missing products keep the base price).
+        """
+        if price_scenarios is None:
+            return np.array([self.market_prices_usd[p] for p in self.products], dtype=np.float64)
+        if isinstance(price_scenarios, dict):
+            columns = np.broadcast_arrays(*[
+                np.asarray(price_scenarios.get(p, self.market_prices_usd[p]), dtype=np.float64)
+                for p in self.products])
+            return np.stack(columns, axis=-1)
+        return np.asarray(price_scenarios, dtype=np.float64)
+
+    def yield_vector(self, recovered_products_kg, products=None):
+        """
+        kg per ton input in self.products order; unpriced products earn nothing.
+        recovered_products_kg is a dict, or a (..., n) array whose columns are
+        named by products (e.g. ElectroRecovery.calculate_products_batch output
+        with ElectroRecovery.products).
+        """
+        if isinstance(recovered_products_kg, dict):
+            return np.array([recovered_products_kg.get(p, 0.0) for p in self.products],
+                            dtype=np.float64)
+        masses = np.asarray(recovered_products_kg, dtype=np.float64)
+        products = self.products if products is None else tuple(products)
+        columns = [masses[..., products.index(p)] if p in products
+                   else np.zeros(masses.shape[:-1]) for p in self.products]
+        return np.stack(columns, axis=-1)
+
+    def cost_vector(self, cost_scenarios=None):
+        """(..., n_cost_items) INR/ton costs in self.costs order; dict overrides as price_vector."""
+        if cost_scenarios is None:
+            return np.array(list(self.costs.values()), dtype=np.float64)
+        if isinstance(cost_scenarios, dict):
+            columns = np.broadcast_arrays(*[
+                np.asarray(cost_scenarios.get(item, base), dtype=np.float64)
+                for item, base in self.costs.items()])
+            return np.stack(columns, axis=-1)
+        return np.asarray(cost_scenarios, dtype=np.float64)
+
+    def calculate_roi_grid(self, tonnages, recovered_products_kg, price_scenarios=None,
+                           fx_rates=None, cost_scenarios=None, products=None, breakdown=False):
+        """
+        calculate_roi over whole grids at once. Inputs follow NumPy broadcasting,
+        e.g. tonnages[:, None] against (S, n_products) price paths and (S,) FX
+        rates gives (n_tonnages, S) results.
+
+        Args:
+            tonnages (array-like): Input tonnage per year.
+            recovered_products_kg (dict | array-like): Product yields in kg per
+                ton input, see yield_vector (products names array columns).
+            price_scenarios (array-like | dict, optional): USD/ton prices, see
+                price_vector. Defaults to self.market_prices_usd.
+            fx_rates (array-like, optional): USD to INR. Defaults to self.exchange_rate.
+            cost_scenarios (array-like | dict, optional): INR/ton cost lines, see
+                cost_vector. Defaults to self.costs.
+            breakdown (bool): Also return per-product revenue (..., n_products).
+
+        Returns:
+            dict: Annual_Revenue, Annual_OpEx, Gross_Profit and Payback_Years arrays.
+        """
+        tonnages = np.asarray(tonnages, dtype=np.float64)
+        prices = self.price_vector(price_scenarios)
+        fx = np.asarray(self.exchange_rate if fx_rates is None else fx_rates, dtype=np.float64)
+        yields = self.yield_vector(recovered_products_kg, products)
+
+        revenue_per_ton = (prices * yields).sum(axis=-1) / 1000.0 * fx
+        revenue = tonnages * revenue_per_ton
+        opex = self.cost_vector(cost_scenarios).sum(axis=-1) * tonnages
+        gross_profit = revenue - opex
+
+        # Same CapEx rule of thumb as calculate_roi
+        profitable = gross_profit > 0
+        capex = np.where(profitable, 2.5 * gross_profit, 10000000)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            payback = np.where(profitable, capex / gross_profit, 999)
+
+        result = {
+            'Annual_Revenue': revenue,
+            'Annual_OpEx': np.broadcast_to(opex, gross_profit.shape),
+            'Gross_Profit': gross_profit,
+            'Payback_Years': payback,
+        }
+        if breakdown:
+            result['Revenue_Breakdown'] = (tonnages[..., np.newaxis] * prices * yields / 1000.0
+                                           * fx[..., np.newaxis])
+        return result
@@ -0,0 +1,93 @@
+"""
+Health Rules module for InnoSortRecycle Digital Twin.
+This module holds the RADORDENA-BIO-01 life-support thresholds as a declarative
+rule table and compiles it into NumPy boolean masks, so whole telemetry arrays
+(e.g. a SCADA historian replay) are evaluated in one call.
+"""
+import operator
+
+import numpy as np
+
+COMPARATORS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+
+# Evaluated top to bottom. Within a group only the first matching rule fires
+# (if/elif); a later group's status overrides an earlier one, and every fired
+# rule contributes its action.
+# (group, signal, comparison, threshold, status, action)
+HEALTH_RULES = (
+    # Rule 1: Acidity
+    ('acidity', 'ph', '>', 2.0, "Warning: pH High", "Dosing H2SO4 (Acid)"),
+    ('acidity', 'ph', '<', 1.5, "Warning: pH Low", "Dosing Water Buffer"),
+    # Rule 2: Temperature
+    ('temperature', 'temp', '>', 35.0, "CRITICAL: Bacterial Heat Stress",
+     "ACTIVATE COOLING SYSTEM"),
+    ('temperature', 'temp', '<', 25.0, "Warning: Low Temp", "Activate Heating"),
+)
+
+
+class HealthRuleEngine:
+    """
+    Compiled rule table.
+    Status code 0 is the default status, code i + 1 is rule i's status.
+    Action bit i is rule i's action; the last bit is the default action, set
+    when no rule fired.
+    """
+
+    def __init__(self, rules=HEALTH_RULES, default_status="Stable",
+                 default_action="Maintaining Aeration"):
+        self.rules = tuple(rules)
+        for rule in self.rules:
+            if rule[2] not in COMPARATORS:
+                raise ValueError(f"Unsupported comparison '{rule[2]}' in rule {rule}")
+
+        self.statuses = (default_status,) + tuple(rule[4] for rule in self.rules)
+        self.actions = tuple(rule[5] for rule in self.rules) + (default_action,)
+        self.signals = tuple(dict.fromkeys(rule[1] for rule in self.rules))
+        self.default_action_bit = len(self.rules)
+        self.mask_dtype = np.uint8 if len(self.actions) <= 8 else np.uint32
+
+        # Group rules (keeping table order) for the if/elif semantics
+        self._groups = {}
+        for index, rule in enumerate(self.rules):
+            self._groups.setdefault(rule[0], []).append(index)
+
+    def action_bit(self, action):
+        """Bitmask value of one action label."""
+        return self.mask_dtype(1 << self.actions.index(action))
+
+    def evaluate(self, **signals):
+        """
+        Evaluates every rule over telemetry arrays, e.g. evaluate(ph=..., temp=...).
+
+        Returns:
+            tuple: (status_codes int8, action_masks) arrays of the broadcast shape.
+        """
+        missing = set(self.signals) - set(signals)
+        if missing:
+            raise ValueError(f"Missing telemetry signals: {sorted(missing)}")
+        arrays = dict(zip(signals, np.broadcast_arrays(
+            *[np.asarray(v, dtype=np.float64) for v in signals.values()])))
+        shape = np.shape(next(iter(arrays.values())))
+
+        status = np.zeros(shape, dtype=np.int8)
+        masks = np.zeros(shape, dtype=self.mask_dtype)
+        for indices in self._groups.values():
+            matched = np.zeros(shape, dtype=bool)
+            for index in indices:
+                _, signal, comparison, threshold, _, _ = self.rules[index]
+                fired = COMPARATORS[comparison](arrays[signal], threshold) & ~matched
+                status[fired] = index + 1
+                masks[fired] |= self.mask_dtype(1 << index)
+                matched |= fired
+
+        masks[masks == 0] = self.mask_dtype(1 << self.default_action_bit)
+        return status, masks
+
+    def decode(self, status_code, action_mask):
+        """(status string, list of actions in rule order) for one evaluated reading."""
+        actions = [label for bit, label in enumerate(self.actions)
+                   if int(action_mask) & (1 << bit)]
+        return self.statuses[int(status_code)], actions
+
+
+LIFE_SUPPORT_RULES = HealthRuleEngine()
@@ -0,0 +1,152 @@
+"""
+Hyperspectral Cube Reader module for InnoSortRecycle Digital Twin.
+This module opens raw HSI camera captures (BSQ/BIL/BIP interleaved binaries with
+an optional ENVI header, or .npy) through np.memmap and streams them line by
+line into RADORDENA-SORT-01, so multi-GB captures run with flat memory use.
+"""
+import re
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from src.ai_engine import DEFAULT_WAVELENGTHS, HyperspectralClassifier
+
+# ENVI 'data type' codes
+ENVI_DTYPES = {
+    1: np.uint8, 2: np.int16, 3: np.int32, 4: np.float32, 5: np.float64,
+    12: np.uint16, 13: np.uint32, 14: np.int64, 15: np.uint64
+}
+
+INTERLEAVES = ('bsq', 'bil', 'bip')
+DATA_SUFFIXES = ('', '.raw', '.img', '.dat', '.bsq', '.bil', '.bip')
+
+# Per-pixel results for one scan line; every field has one entry per sample
+LineResult = namedtuple('LineResult', [
+    'line', 'class_codes', 'confidences', 'route_ids', 'integrity_index', 'is_anomaly'
+])
+
+
+def read_envi_header(hdr_path):
+    """
+    Parses the subset of an ENVI .hdr file needed to map the raw cube.
+    Returns: dict with lowercase keys; 'wavelength' becomes a float array.
+    """
+    text = Path(hdr_path).read_text(encoding='utf-8', errors='replace')
+    header = {}
+    for key, value in re.findall(r'^\s*([^=\n]+?)\s*=\s*(\{[^}]*\}|[^\n]*)', text, re.M):
+        header[key.strip().lower()] = value.strip()
+
+    if 'wavelength' in header:
+        values = header['wavelength'].strip('{}').split(',')
+        header['wavelength'] = np.array([float(v) for v in values if v.strip()])
+    return header
+
+
+class HyperspectralCube:
+    """
+    Memory-mapped (lines x samples x bands) capture.
+    A 'line' is one conveyor scan line / frame, a 'sample' one pixel across it.
+    Nothing is read from disk until a line is actually touched.
+    """
+
+    def __init__(self, path, lines, samples, bands, interleave='bip',
+                 dtype=np.float32, byte_order='<', header_offset=0, wavelengths=None):
+        interleave = interleave.lower()
+        if interleave not in INTERLEAVES:
+            raise ValueError(f"Unknown interleave '{interleave}', expected one of {INTERLEAVES}")
+
+        self.path = Path(path)
+        self.lines, self.samples, self.bands = int(lines), int(samples), int(bands)
+        self.interleave = interleave
+        self.wavelengths = None if wavelengths is None else np.asarray(wavelengths, dtype=float)
+
+        storage_shape = {
+            'bsq': (self.bands, self.lines, self.samples),
+            'bil': (self.lines, self.bands, self.samples),
+            'bip': (self.lines, self.samples, self.bands),
+        }[interleave]
+        self.data = np.memmap(self.path, dtype=np.dtype(dtype).newbyteorder(byte_order),
+                              mode='r', offset=int(header_offset), shape=storage_shape)
+
+    @classmethod
+    def from_envi(cls, hdr_path, data_path=None):
+        """Opens a capture described by an ENVI header (data file defaults to the same stem)."""
+        hdr_path = Path(hdr_path)
+        header = read_envi_header(hdr_path)
+        if data_path is None:
+            candidates = [hdr_path.with_suffix(ext) for ext in DATA_SUFFIXES]
+            existing = [p for p in candidates if p.is_file()]
+            if not existing:
+                raise FileNotFoundError(f"No data file found next to {hdr_path}")
+            data_path = existing[0]
+
+        return cls(data_path,
+                   lines=int(header['lines']),
+                   samples=int(header['samples']),
+                   bands=int(header['bands']),
+                   interleave=header.get('interleave', 'bsq'),
+                   dtype=ENVI_DTYPES[int(header.get('data type', 4))],
+                   byte_order='>' if header.get('byte order', '0') == '1' else '<',
+                   header_offset=int(header.get('header offset', 0)),
+                   wavelengths=header.get('wavelength'))
+
+    @classmethod
+    def from_npy(cls, npy_path, wavelengths=None):
+        """Opens a (lines, samples, bands) .npy capture memory-mapped (BIP layout)."""
+        npy_path = Path(npy_path)
+        cube = cls.__new__(cls)
+        cube.path = npy_path
+        cube.data = np.load(npy_path, mmap_mode='r')
+        if cube.data.ndim != 3:
+            raise ValueError(f"Expected a 3-D (lines, samples, bands) array, got {cube.data.shape}")
+        cube.lines, cube.samples, cube.bands = cube.data.shape
+        cube.interleave = 'bip'
+        cube.wavelengths = None if wavelengths is None else np.asarray(wavelengths, dtype=float)
+        return cube
+
+    def __len__(self):
+        return self.lines
+
+    def line(self, index):
+        """Zero-copy (samples, bands) view of one scan line, whatever the interleave."""
+        if self.interleave == 'bip':
+            return self.data[index]
+        if self.interleave == 'bil':
+            return self.data[index].T
+        return self.data[:, index, :].T
+
+    def iter_lines(self, start=0, stop=None):
+        """Yields (line_index, (samples, bands) view) pairs."""
+        stop = self.lines if stop is None else min(stop, self.lines)
+        for index in range(start, stop):
+            yield index, self.line(index)
+
+    def make_classifier(self):
+        """
+        HyperspectralClassifier on the capture's own wavelength grid. Captures
+        without wavelengths must match the default 300-band grid.
+        """
+        if self.wavelengths is None:
+            if self.bands != len(DEFAULT_WAVELENGTHS):
+                raise ValueError(
+                    f"Cube has {self.bands} bands but no wavelength list; pass wavelengths "
+                    f"(only {len(DEFAULT_WAVELENGTHS)}-band captures may use the default grid)")
+        elif len(self.wavelengths) != self.bands:
+            raise ValueError("Header wavelength count does not match the number of bands")
+        return HyperspectralClassifier(self.wavelengths)
+
+    def classify_lines(self, classifier=None, start=0, stop=None):
+        """
+        Streams the capture through classify_batch and the swelling screen.
+        Yields: LineResult per scan line.
+        """
+        classifier = classifier or self.make_classifier()
+        if len(classifier.wavelengths) != self.bands:
+            raise ValueError(f"Classifier grid has {len(classifier.wavelengths)} bands, "
+                             f"cube has {self.bands}")
+        for index, spectra in self.iter_lines(start, stop):
+            codes, confidences, routes = classifier.classify_batch(spectra)
+            screen = classifier.screen_anomalies(spectra)
+            yield LineResult(index, codes, confidences, routes,
+                             screen.integrity_index, screen.is_anomaly)
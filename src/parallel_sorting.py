@@ -0,0 +1,131 @@
+"""
+Parallel Sorting module for InnoSortRecycle Digital Twin.
+This module spreads RADORDENA-SORT-01 classification over a process pool.
+Spectra frames live in a multiprocessing.shared_memory block, so workers read
+their slice in place and only the small per-object result arrays are pickled.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.ai_engine import HyperspectralClassifier
+
+# Per-worker state, populated by _init_worker in each pool process
+_WORKER = {}
+
+
+def _init_worker(wavelengths):
+    _WORKER['classifier'] = HyperspectralClassifier(wavelengths)
+    _WORKER['blocks'] = {}
+
+
+def _attach(name):
+    """Attaches (once per worker) to the parent's shared block."""
+    blocks = _WORKER['blocks']
+    if name not in blocks:
+        # The parent keeps a single live block; drop mappings of reallocated ones
+        for stale in blocks.values():
+            stale.close()
+        blocks.clear()
+        # Pool workers share the parent's resource tracker, so the parent's
+        # unlink() in close() remains the single point of cleanup
+        blocks[name] = shared_memory.SharedMemory(name=name)
+    return blocks[name]
+
+
+def _classify_slice(name, shape, dtype, start, stop):
+    shm = _attach(name)
+    spectra = np.ndarray(shape, dtype=dtype, buffer=shm.buf)[start:stop]
+    return _WORKER['classifier'].classify_batch(spectra)
+
+
+class SharedMemorySorter:
+    """
+    RADORDENA-SORT-01 Multi-Core Mode.
+    Use as a context manager so the pool and the shared block are released:
+
+        with SharedMemorySorter(n_workers=4) as sorter:
+            frame = sorter.frame(n_objects)   # write spectra here (no copy)
+            codes, confidences, routes = sorter.classify_frame(n_objects)
+
+    Frames stay readable for as long as the sorter object is alive, even after
+    close() or after a larger frame() has moved the data to a new block.
+    """
+
+    def __init__(self, n_workers=None, capacity=65536, wavelengths=None,
+                 dtype=np.float32, min_slice=1024):
+        self.classifier = HyperspectralClassifier(wavelengths)
+        self.n_workers = int(n_workers or os.cpu_count() or 1)
+        self.n_bands = len(self.classifier.wavelengths)
+        self.dtype = np.dtype(dtype)
+        self.min_slice = int(min_slice)
+
+        self._shm = None
+        self._retired = []
+        self._capacity = 0
+        self._allocate(int(capacity))
+        self._pool = ProcessPoolExecutor(max_workers=self.n_workers,
+                                         initializer=_init_worker,
+                                         initargs=(self.classifier.wavelengths,))
+
+    def _allocate(self, capacity):
+        self._retire_block()
+        nbytes = max(1, capacity * self.n_bands * self.dtype.itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._capacity = capacity
+
+    def _retire_block(self):
+        # Unlinked but not closed: unmapping under a frame the caller still
+        # holds would segfault, so mappings live until the sorter is collected
+        if self._shm is not None:
+            self._shm.unlink()
+            self._retired.append(self._shm)
+            self._shm = None
+
+    def frame(self, n_objects):
+        """
+        Returns an (n_objects, bands) view on the shared block for the camera
+        driver to fill. Grows the block if needed; earlier frames keep viewing
+        the old block, so rows written there are not seen by classify_frame.
+        """
+        if self._shm is None:
+            raise ValueError("SharedMemorySorter is closed")
+        if n_objects > self._capacity:
+            self._allocate(n_objects)
+        return np.ndarray((n_objects, self.n_bands), dtype=self.dtype,
+                          buffer=self._shm.buf)
+
+    def classify_frame(self, n_objects):
+        """
+        Classifies the first n_objects rows of the shared block across the pool.
+        Returns: (class_codes, confidences, route_ids) in object order.
+        """
+        n_slices = max(1, min(self.n_workers, n_objects // self.min_slice))
+        bounds = np.linspace(0, n_objects, n_slices + 1).astype(int)
+        shape = (n_objects, self.n_bands)
+
+        futures = [self._pool.submit(_classify_slice, self._shm.name, shape,
+                                     self.dtype.str, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        results = [f.result() for f in futures]
+
+        return tuple(np.concatenate(parts) for parts in zip(*results))
+
+    def classify_batch(self, spectra):
+        """Copies an in-memory (N, bands) block into shared memory and classifies it."""
+        spectra = np.asarray(spectra)
+        self.frame(len(spectra))[:] = spectra
+        return self.classify_frame(len(spectra))
+
+    def close(self):
+        """Shuts down the worker pool and unlinks the shared block."""
+        self._pool.shutdown(wait=True)
+        self._retire_block()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
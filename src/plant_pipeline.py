@@ -0,0 +1,118 @@
+"""
+Plant Pipeline module for InnoSortRecycle Digital Twin.
+This module chains the plant economics stages (reactor mass balance ->
+electro-recovery products -> ROI -> multi-year DCF) behind one object. Each
+stage is memoized in a bounded LRU keyed on its own inputs, so changing one
+parameter (e.g. the capacity slider) only recomputes the stages downstream
+of it, and hit/miss counters are exposed per stage.
+"""
+from functools import lru_cache
+
+from src.dcf import DiscountedCashFlow
+from src.financials import FinancialModel
+from src.simulation_engine import (BioleachingReactor, ElectroRecovery, BLACK_MASS_METALS,
+                                   CASE_STUDY_BM_KG, CASE_STUDY_COMPOSITION_VECTOR)
+
+PIPELINE_STAGES = ('mass_balance', 'products', 'roi', 'dcf')
+
+
+def _frozen(mapping):
+    """Hashable, order-independent key for a dict of scalars (None passes through)."""
+    return None if mapping is None else tuple(sorted(mapping.items()))
+
+
+class PlantEconomicsPipeline:
+    """
+    Memoized mass balance -> products -> ROI -> DCF chain.
+    Stage results are cached as tuples (immutable); run() hands out fresh dicts,
+    so callers can modify them without corrupting the cache.
+    """
+
+    def __init__(self, reactor=None, finance=None, dcf=None, maxsize=128):
+        self.reactor = reactor or BioleachingReactor()
+        self.finance = finance or FinancialModel()
+        self.dcf = dcf or DiscountedCashFlow()
+
+        self._stages = {
+            'mass_balance': lru_cache(maxsize=maxsize)(self._mass_balance),
+            'products': lru_cache(maxsize=maxsize)(self._products),
+            'roi': lru_cache(maxsize=maxsize)(self._roi),
+            'dcf': lru_cache(maxsize=maxsize)(self._dcf),
+        }
+        self._extractor = lru_cache(maxsize=8)(ElectroRecovery)
+
+    def _mass_balance(self, black_mass_kg, efficiency):
+        recovered, acid, water = self.reactor.mass_balance_batch(
+            CASE_STUDY_COMPOSITION_VECTOR, black_mass_kg, efficiency=efficiency)
+        return (tuple(zip(BLACK_MASS_METALS, recovered[0].tolist()))
+                + (('H2SO4_Consumed', float(acid[0])), ('Water_Usage', float(water[0]))))
+
+    def _products(self, metals, route):
+        return tuple(self._extractor(route).calculate_products(dict(metals)).items())
+
+    def _roi(self, tonnage_per_year, products, prices, exchange_rate, costs):
+        # Scenario overrides go to a throwaway model so self.finance stays at its defaults
+        scenario = FinancialModel()
+        scenario.market_prices_usd = dict(self.finance.market_prices_usd, **dict(prices or ()))
+        scenario.costs = dict(self.finance.costs, **dict(costs or ()))
+        scenario.exchange_rate = self.finance.exchange_rate if exchange_rate is None \
+            else exchange_rate
+        result = scenario.calculate_roi(tonnage_per_year, dict(products))
+        result['Revenue_Breakdown'] = tuple(result['Revenue_Breakdown'].items())
+        return tuple(result.items())
+
+    def _dcf(self, roi, tonnage_per_year):
+        result = self.dcf.evaluate_roi(dict(roi), tonnage_per_year)
+        return (('NPV', float(result['NPV'])), ('IRR', float(result['IRR'])),
+                ('Payback_Years', float(result['Payback_Years'])),
+                ('Cash_Flows', tuple(result['Cash_Flows'].tolist())))
+
+    def run(self, tonnage_per_year, black_mass_kg=CASE_STUDY_BM_KG, efficiency=None,
+            route='hydroxide', prices=None, exchange_rate=None, costs=None):
+        """
+        Evaluates the full chain, reusing every cached stage whose inputs are unchanged.
+
+        Args:
+            tonnage_per_year (float): Plant capacity (tons input per year).
+            black_mass_kg (float): Black mass per ton input (dashboard basis: 350 kg).
+            efficiency (float, optional): Reactor recovery; defaults to the reactor's.
+            route (str): ElectroRecovery product route.
+            prices, costs (dict, optional): Overrides of FinancialModel prices / costs.
+            exchange_rate (float, optional): USD to INR override.
+
+        Returns:
+            dict: 'Mass_Balance', 'Products', 'ROI' (calculate_roi format) and 'DCF'.
+        """
+        efficiency = self.reactor.efficiency if efficiency is None else float(efficiency)
+        stages = self._stages
+        metals = stages['mass_balance'](float(black_mass_kg), efficiency)
+        products = stages['products'](
+            tuple(item for item in metals if item[0] in BLACK_MASS_METALS), route)
+        roi = stages['roi'](float(tonnage_per_year), products, _frozen(prices),
+                            exchange_rate, _frozen(costs))
+        dcf = stages['dcf'](roi, float(tonnage_per_year))
+
+        roi = dict(roi)
+        roi['Revenue_Breakdown'] = dict(roi['Revenue_Breakdown'])
+        dcf = dict(dcf)
+        dcf['Cash_Flows'] = list(dcf['Cash_Flows'])
+        return {
+            'Mass_Balance': dict(metals),
+            'Products': dict(products),
+            'ROI': roi,
+            'DCF': dcf,
+        }
+
+    def cache_info(self):
+        """{stage: {'hits', 'misses', 'size', 'maxsize'}} counters for every stage."""
+        info = {}
+        for name in PIPELINE_STAGES:
+            stats = self._stages[name].cache_info()
+            info[name] = {'hits': stats.hits, 'misses': stats.misses,
+                          'size': stats.currsize, 'maxsize': stats.maxsize}
+        return info
+
+    def cache_clear(self):
+        """Drops every cached stage result (e.g. after editing model constants)."""
+        for stage in self._stages.values():
+            stage.cache_clear()
@@ -0,0 +1,131 @@
+"""
+Price Paths module for InnoSortRecycle Digital Twin.
+This module simulates monthly commodity prices (Li2CO3, Co, Ni and Mn salts)
+and the USD/INR rate as correlated stochastic processes, producing
+(paths, months, factors) arrays that feed FinancialModel.calculate_roi_grid
+directly, plus VaR/CVaR of the resulting revenue.
+"""
+import numpy as np
+
+from src.financials import FinancialModel
+
+FX_FACTOR = 'USD_INR'
+
+# factor -> (model, parameters), all in log space with annual units.
+# 'gbm': drift mu, volatility sigma. 'ou': exponential Ornstein-Uhlenbeck
+# reverting to the starting price at speed kappa (1/year), volatility sigma.
+DEFAULT_PRICE_MODELS = {
+    'Li2CO3': ('ou', {'kappa': 0.8, 'sigma': 0.45}),
+    'Co(OH)2': ('ou', {'kappa': 0.5, 'sigma': 0.35}),
+    'Ni(OH)2': ('gbm', {'mu': 0.0, 'sigma': 0.25}),
+    'MnCO3': ('ou', {'kappa': 0.6, 'sigma': 0.20}),
+    FX_FACTOR: ('gbm', {'mu': 0.03, 'sigma': 0.05}),
+}
+
+# Monthly log-return correlations; battery metals co-move, a weaker rupee
+# (higher USD/INR) slightly lags commodity rallies.
+DEFAULT_CORRELATION = np.array([
+    [1.00, 0.40, 0.35, 0.20, -0.10],
+    [0.40, 1.00, 0.60, 0.30, -0.10],
+    [0.35, 0.60, 1.00, 0.30, -0.15],
+    [0.20, 0.30, 0.30, 1.00, -0.05],
+    [-0.10, -0.10, -0.15, -0.05, 1.00],
+])
+
+
+def value_at_risk(values, alpha=0.95):
+    """
+    Shortfall risk of an outcome distribution (e.g. annual revenue per path).
+
+    Returns:
+        dict: 'Mean', 'VaR' (mean minus the (1 - alpha) quantile) and 'CVaR'
+            (mean minus the average of outcomes at or below that quantile).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    mean = values.mean()
+    quantile = np.quantile(values, 1.0 - alpha)
+    tail = values[values <= quantile]
+    return {
+        'Mean': float(mean),
+        'VaR': float(mean - quantile),
+        'CVaR': float(mean - tail.mean()),
+        'Alpha': alpha,
+    }
+
+
+class PricePathSimulator:
+    """
+    Correlated monthly price paths. Every factor follows
+    x[t+1] = a x[t] + b + c z[t] in log price, with z Cholesky-correlated
+    across factors, which covers both GBM (a = 1) and exponential OU exactly.
+    """
+
+    def __init__(self, finance=None, models=None, correlation=DEFAULT_CORRELATION,
+                 start_prices=None):
+        self.finance = finance or FinancialModel()
+        self.models = dict(DEFAULT_PRICE_MODELS, **(models or {}))
+        self.factors = self.finance.products + (FX_FACTOR,)
+        missing = set(self.factors) - set(self.models)
+        if missing:
+            raise ValueError(f"No price model for {sorted(missing)}")
+
+        base = dict(self.finance.market_prices_usd, **{FX_FACTOR: self.finance.exchange_rate})
+        base.update(start_prices or {})
+        self.start_prices = np.array([base[f] for f in self.factors], dtype=np.float64)
+
+        correlation = np.asarray(correlation, dtype=np.float64)
+        # Raises LinAlgError for a matrix that is not positive definite
+        self.cholesky = np.linalg.cholesky(correlation)
+
+    def _coefficients(self, dt):
+        """(a, b, c) per factor for a step of dt years."""
+        log_start = np.log(self.start_prices)
+        a, b, c = np.empty((3, len(self.factors)))
+        for i, factor in enumerate(self.factors):
+            kind, params = self.models[factor]
+            sigma = params['sigma']
+            if kind == 'gbm':
+                a[i] = 1.0
+                b[i] = (params['mu'] - 0.5 * sigma ** 2) * dt
+                c[i] = sigma * np.sqrt(dt)
+            elif kind == 'ou':
+                a[i] = np.exp(-params['kappa'] * dt)
+                b[i] = params.get('log_mean', log_start[i]) * (1.0 - a[i])
+                c[i] = sigma * np.sqrt((1.0 - a[i] ** 2) / (2.0 * params['kappa']))
+            else:
+                raise ValueError(f"Unknown price model '{kind}' for {factor}")
+        return a, b, c
+
+    def simulate(self, n_paths, n_months=12, seed=0, dtype=np.float64):
+        """
+        Simulates month-end prices.
+
+        Returns:
+            np.ndarray: (n_paths, n_months, n_factors) prices in self.factors
+                order (USD/ton for products, INR per USD for the last column).
+        """
+        rng = np.random.default_rng(seed)
+        a, b, c = self._coefficients(1.0 / 12.0)
+        paths = np.empty((n_paths, n_months, len(self.factors)), dtype=dtype)
+
+        log_price = np.broadcast_to(np.log(self.start_prices), (n_paths, len(self.factors)))
+        for month in range(n_months):
+            shocks = rng.standard_normal((n_paths, len(self.factors))) @ self.cholesky.T
+            log_price = a * log_price + b + c * shocks
+            paths[:, month] = np.exp(log_price)
+        return paths
+
+    def monthly_revenue(self, paths, recovered_products_kg, tonnage_per_year):
+        """(n_paths, n_months) revenue in INR, one twelfth of annual tonnage per month."""
+        return self.finance.calculate_roi_grid(
+            tonnage_per_year / 12.0, recovered_products_kg, paths[..., :-1],
+            paths[..., -1])['Annual_Revenue']
+
+    def revenue_risk(self, recovered_products_kg, tonnage_per_year, n_paths=100_000,
+                     alpha=0.95, seed=0):
+        """VaR / CVaR of first-year revenue over n_paths simulated years."""
+        paths = self.simulate(n_paths, 12, seed)
+        annual = self.monthly_revenue(paths, recovered_products_kg, tonnage_per_year).sum(axis=1)
+        risk = value_at_risk(annual, alpha)
+        risk['Annual_Revenue'] = annual
+        return risk
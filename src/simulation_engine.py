@@ -2,8 +2,80 @@
 Simulation Engine module for InnoSortRecycle Digital Twin.
 This module handles the mass balance stoichiometry and reaction kinetics for the process.
 """
+import json
+from functools import lru_cache
+from pathlib import Path
+
 import numpy as np
 
+from src.health_rules import LIFE_SUPPORT_RULES
+from src.reactor_kinetics import METAL, BioleachingKinetics
+
+
+# Based on PDF "Case Study": 350kg BM -> 25kg Li, 50kg Ni, 35kg Mn, 40kg Co.
+# Fractions are derived once from this reliable data.
+CASE_STUDY_BM_KG = 350.0
+BLACK_MASS_METALS = ('Li', 'Ni', 'Mn', 'Co')
+CASE_STUDY_COMPOSITION = {
+    'Li': 25.0 / CASE_STUDY_BM_KG,
+    'Ni': 50.0 / CASE_STUDY_BM_KG,
+    'Mn': 35.0 / CASE_STUDY_BM_KG,
+    'Co': 40.0 / CASE_STUDY_BM_KG
+}
+CASE_STUDY_COMPOSITION_VECTOR = np.array([CASE_STUDY_COMPOSITION[m] for m in BLACK_MASS_METALS])
+
+H2SO4_KG_PER_KG_BM = 0.5  # Industrial heuristic
+WATER_L_PER_KG_BM = 4.0  # 4:1 L/S ratio often used
+
+METAL_MOLAR_MASSES = {'Li': 6.94, 'Ni': 58.69, 'Mn': 54.94, 'Co': 58.93}
+PRODUCT_ROUTES_PATH = Path(__file__).with_name('product_routes.json')
+
+
+def logistic_recovery(efficiency, residence_time_days, time_points, rate_constant=1.2):
+    """
+    Logistic growth model for bacteria-driven leaching (broadcasts over all inputs).
+    C(t) = C_max / (1 + exp(-k*(t - t_mid))), t_mid = residence time / 2
+    """
+    time_midpoint = np.asarray(residence_time_days) / 2.0
+    return efficiency / (1 + np.exp(-rate_constant * (time_points - time_midpoint)))
+
+
+def sweep_kinetics(efficiencies, residence_times, time_points, rate_constant=1.2,
+                   target_recovery=0.90):
+    """
+    Reactor design-space sweep: logistic kinetics for every (efficiency,
+    residence time) pair in one broadcast, instead of one BioleachingReactor
+    per combination.
+
+    Args:
+        efficiencies (array-like): E candidate efficiencies.
+        residence_times (array-like): R candidate residence times (days).
+        time_points (array-like): T evaluation times (days).
+        rate_constant (float | array-like): Logistic k, broadcastable to (E, R).
+        target_recovery (float): Recovery fraction for the time-to-target map.
+
+    Returns:
+        tuple: (recovery (E, R, T), days_to_target (E, R)). Cells whose efficiency
+            never reaches the target get np.inf.
+    """
+    efficiency = np.asarray(efficiencies, dtype=np.float64)[:, np.newaxis]
+    residence = np.asarray(residence_times, dtype=np.float64)[np.newaxis, :]
+    time_points = np.asarray(time_points, dtype=np.float64)
+    rate_constant = np.asarray(rate_constant, dtype=np.float64)
+    # Per-cell rate constants need a trailing time axis; a scalar broadcasts as is
+    cell_rate = rate_constant[..., np.newaxis] if rate_constant.ndim else rate_constant
+
+    recovery = logistic_recovery(efficiency[..., np.newaxis], residence[..., np.newaxis],
+                                 time_points, cell_rate)
+
+    # Closed-form inverse of the logistic: t = t_mid - ln(C_max/C - 1) / k
+    reachable = efficiency > target_recovery
+    with np.errstate(divide='ignore', invalid='ignore'):
+        days = residence / 2.0 - np.log(efficiency / target_recovery - 1.0) / rate_constant
+    days_to_target = np.where(reachable, np.maximum(days, 0.0), np.inf)
+
+    return recovery, days_to_target
+
 
 class BioleachingReactor:
     """
@@ -15,6 +87,7 @@ class BioleachingReactor:
         self.volume_l = float(volume_l)
         self.efficiency = float(efficiency)
         self.residence_time = float(residence_time_days)
+        self.rate_constant = 1.2  # Logistic leaching rate constant (1/day)
 
         # Stoichiometry constants (simplified for molecular weights)
         self.molecular_weights = {
@@ -56,43 +129,56 @@ class BioleachingReactor:
         Agent Logic: Life Support Loop
         returns: (Status Message, Action Taken)
         """
-        status = "Stable"
-        actions = []
-
-        # Rule 1: Acidity
-        if current_ph > 2.0:
-            status = "Warning: pH High"
-            actions.append("Dosing H2SO4 (Acid)")
-        elif current_ph < 1.5:
-            status = "Warning: pH Low"
-            actions.append("Dosing Water Buffer")
-
-        # Rule 2: Temperature
-        if current_temp > 35.0:
-            status = "CRITICAL: Bacterial Heat Stress"
-            actions.append("ACTIVATE COOLING SYSTEM")
-        elif current_temp < 25.0:
-            status = "Warning: Low Temp"
-            actions.append("Activate Heating")
-
-        if not actions:
-            actions.append("Maintaining Aeration")
+        # Thresholds and priority order live in the declarative HEALTH_RULES table
+        status_code, action_mask = LIFE_SUPPORT_RULES.evaluate(ph=current_ph, temp=current_temp)
+        status, actions = LIFE_SUPPORT_RULES.decode(status_code, action_mask)
 
         return status, actions
 
-    def simulate_kinetics(self, time_points):
+    def simulate_kinetics(self, time_points, model='logistic'):
         """
         Simulate the leaching concentration over time using Michaelis-Menten-like kinetics
         approximated for bioleaching (S-curve).
+
+        model='logistic': closed-form S-curve (fast, used by the dashboards).
+        model='ode': coupled biomass / iron / DO dynamics from reactor_kinetics,
+            started at t=0 with leachable fraction = reactor efficiency.
+        """
+        if model == 'ode':
+            shape = np.shape(time_points)
+            times = np.ravel(np.asarray(time_points, dtype=np.float64))
+            start_at_zero = times[0] > 0
+            if start_at_zero:
+                times = np.concatenate([[0.0], times])
+            recovery = BioleachingKinetics(metal_max=self.efficiency).recovery(times)[0]
+            # [()] turns a scalar time's 0-d result into a scalar, as the logistic path
+            return (recovery[1:] if start_at_zero else recovery).reshape(shape)[()]
+        if model != 'logistic':
+            raise ValueError(f"Unknown kinetics model '{model}'")
+
+        return logistic_recovery(self.efficiency, self.residence_time, time_points,
+                                 self.rate_constant)
+
+    def simulate_continuous(self, flow_rate_l_per_day, n_tanks=3, tank_volume_l=None):
+        """
+        Continuous-flow mode: steady-state recovery along a cascade of n_tanks
+        CSTRs in series (each tank_volume_l, default self.volume_l), solved
+        algebraically with the reactor_kinetics ODE model.
+
+        Args:
+            flow_rate_l_per_day (float | array-like): Slurry flow rate(s); an
+                array sizes many throughputs in one call.
+
+        Returns:
+            np.ndarray: (..., n_tanks) dissolved metal fraction leaving each tank.
         """
-        # Logistic growth model for bacteria-driven leaching
-        # C(t) = C_max / (1 + exp(-k*(t - t_mid)))
-        rate_constant = 1.2  # Rate constant
-        time_midpoint = self.residence_time / 2.0
+        flow = np.asarray(flow_rate_l_per_day, dtype=np.float64)
+        volume = self.volume_l if tank_volume_l is None else float(tank_volume_l)
+        residence = np.repeat(volume / flow.reshape(-1, 1), n_tanks, axis=1)
 
-        recovery = self.efficiency / \
-            (1 + np.exp(-rate_constant * (time_points - time_midpoint)))
-        return recovery
+        kinetics = BioleachingKinetics(metal_max=np.full(len(residence), self.efficiency))
+        states = kinetics.steady_state_cascade(residence)
+        return states[..., METAL].T.reshape(flow.shape + (n_tanks,))
 
     def mass_balance(self, black_mass_input_kg):
         """
@@ -101,71 +187,125 @@ class BioleachingReactor:
         PDF Data: 1 ton battery -> 350kg Black Mass
         Black Mass Composition: Li: 7.1%, Ni: 14.3%, Mn: 10%, Co: 11.4%
         (Approx from PDF '25kg Li from 350kg BM' -> ~7%)
+        Thin dict wrapper over mass_balance_batch. An array input broadcasts as
+        before: every value in the dict then has the input's shape.
         """
-        # Based on PDF "Case Study": 350kg BM -> 25kg Li, 50kg Ni, 35kg Mn, 40kg Co.
-        # Let's derive fractions from this reliable data.
-        bm_mass = 350.0
-        composition = {
-            'Li': 25.0 / bm_mass,
-            'Ni': 50.0 / bm_mass,
-            'Mn': 35.0 / bm_mass,
-            'Co': 40.0 / bm_mass
-        }
+        black_mass = np.asarray(black_mass_input_kg, dtype=np.float64)
+        recovered, acid, water = self.mass_balance_batch(CASE_STUDY_COMPOSITION_VECTOR,
+                                                         black_mass.ravel())
+
+        if black_mass.ndim == 0:
+            outputs = dict(zip(BLACK_MASS_METALS, recovered[0].tolist()))
+            outputs['H2SO4_Consumed'] = float(acid[0])
+            outputs['Water_Usage'] = float(water[0])
+        else:
+            outputs = {metal: recovered[:, i].reshape(black_mass.shape)
+                       for i, metal in enumerate(BLACK_MASS_METALS)}
+            outputs['H2SO4_Consumed'] = acid.reshape(black_mass.shape)
+            outputs['Water_Usage'] = water.reshape(black_mass.shape)
+
+        return outputs, dict(CASE_STUDY_COMPOSITION)
+
+    def mass_balance_batch(self, compositions, black_mass_kg, efficiency=None):
+        """
+        Columnar mass balance for N assayed black-mass lots in one call.
 
-        outputs = {}
-        for metal, fraction in composition.items():
-            theoretical_mass = black_mass_input_kg * fraction
-            recovered_mass = theoretical_mass * self.efficiency
-            outputs[metal] = recovered_mass
+        Args:
+            compositions (array-like): (N, 4) or (4,) mass fractions in
+                BLACK_MASS_METALS order (Li, Ni, Mn, Co).
+            black_mass_kg (array-like): (N,) or scalar lot masses.
+            efficiency (array-like, optional): (N,) or scalar recovery; defaults
+                to the reactor efficiency.
+
+        Returns:
+            tuple: (recovered metals (N, 4) kg, H2SO4 consumed (N,) kg,
+                water usage (N,) L)
+        """
+        compositions = np.atleast_2d(np.asarray(compositions, dtype=np.float64))
+        black_mass_kg = np.atleast_1d(np.asarray(black_mass_kg, dtype=np.float64))
+        black_mass_kg = np.broadcast_to(
+            black_mass_kg, np.broadcast_shapes(black_mass_kg.shape, compositions.shape[:1]))
+        efficiency = self.efficiency if efficiency is None else \
+            np.asarray(efficiency, dtype=np.float64)[..., np.newaxis]
+
+        theoretical = black_mass_kg[:, np.newaxis] * compositions
+        recovered = theoretical * efficiency
 
         # Reagent Consumption (PDF: "Bacteria/nutrients cheap", 5% H2SO4)
         # 4Fe2+ + O2 + 4H+ -> ...
         # Simplified: Acid consumption proportionality
-        # Assume 0.5 kg H2SO4 per kg Black Mass (Industrial heuristic)
-        outputs['H2SO4_Consumed'] = black_mass_input_kg * 0.5
-        outputs['Water_Usage'] = black_mass_input_kg * \
-            4.0  # 4:1 L/S ratio often used
+        acid = black_mass_kg * H2SO4_KG_PER_KG_BM
+        water = black_mass_kg * WATER_L_PER_KG_BM
+
+        return recovered, acid, water
+
+
+def load_product_routes(path=PRODUCT_ROUTES_PATH):
+    """
+    Reads harvest routes (metal -> salt definitions) from a JSON file, so new
+    salts can be added without code edits. Returns: {route: [product spec, ...]}.
+    """
+    return {name: route['products'] for name, route in _read_routes(str(path)).items()}
+
 
-        return outputs, composition
+@lru_cache(maxsize=8)
+def _read_routes(path):
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
 
 
 class ElectroRecovery:
     """
     Simulates the electrochemical recovery and precipitation layer.
+    Metal -> salt stoichiometry is precomputed into a (metals x salts)
+    conversion matrix, so converting N lots is a single matmul.
     """
 
-    def __init__(self):
+    def __init__(self, route='hydroxide', products=None, routes_path=PRODUCT_ROUTES_PATH):
         self.purity = 0.999  # 99.9%
+        self.route = route
+        if products is None:
+            products = load_product_routes(routes_path)[route]
+
+        self.metals = BLACK_MASS_METALS
+        self.products = tuple(spec['salt'] for spec in products)
+
+        # Conversion factor = MW(salt) / (atoms per formula * MW(metal))
+        self.conversion_matrix = np.zeros((len(self.metals), len(self.products)))
+        for column, spec in enumerate(products):
+            if spec['metal'] not in self.metals:
+                raise ValueError(f"{spec['salt']}: unsupported metal '{spec['metal']}'")
+            mw_metal = METAL_MOLAR_MASSES[spec['metal']]
+            self.conversion_matrix[self.metals.index(spec['metal']), column] = \
+                spec['molar_mass'] / (spec.get('metal_atoms', 1) * mw_metal)
+        self.conversion_matrix.setflags(write=False)
+
+    def calculate_products_batch(self, metal_masses, apply_purity=True):
+        """
+        Converts (N, 4) metal masses (BLACK_MASS_METALS order, e.g. the first
+        output of mass_balance_batch) to (N, salts) product masses.
+        With apply_purity, only the in-spec (purity) share of each salt is counted.
+        """
+        products = np.asarray(metal_masses, dtype=np.float64) @ self.conversion_matrix
+        if apply_purity:
+            products *= self.purity
+        return products
 
     def calculate_products(self, metal_masses):
         """
-        Convert metal mass to salt mass.
+        Convert metal mass to salt mass (default route).
         Li -> Li2CO3
         Co -> Co(OH)2
         Ni -> Ni(OH)2
         Mn -> MnCO3
+        Dict wrapper over calculate_products_batch; reports gross salt mass.
+        Array-valued masses (e.g. from mass_balance on an array of lots)
+        broadcast as before: every value in the dict then has their shape.
         """
-        # Molecular weights
-        mw_li = 6.94
-        mw_li2co3 = 73.89
-        factor_li = mw_li2co3 / (2 * mw_li)
-
-        mw_co = 58.93
-        mw_cooh2 = 92.95
-        factor_co = mw_cooh2 / mw_co
-
-        mw_ni = 58.69
-        mw_nioh2 = 92.71
-        factor_ni = mw_nioh2 / mw_ni
-
-        mw_mn = 54.94
-        mw_mnco3 = 114.95
-        factor_mn = mw_mnco3 / mw_mn
-
-        products = {
-            'Li2CO3': metal_masses.get('Li', 0) * factor_li,
-            'Co(OH)2': metal_masses.get('Co', 0) * factor_co,
-            'Ni(OH)2': metal_masses.get('Ni', 0) * factor_ni,
-            'MnCO3': metal_masses.get('Mn', 0) * factor_mn
-        }
-        return products
+        masses = np.stack(np.broadcast_arrays(
+            *[np.asarray(metal_masses.get(metal, 0), dtype=np.float64) for metal in self.metals]),
+            axis=-1)
+        products = self.calculate_products_batch(masses, apply_purity=False)
+        if masses.ndim == 1:
+            return dict(zip(self.products, products.tolist()))
+        return {salt: products[..., i] for i, salt in enumerate(self.products)}
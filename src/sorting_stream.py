@@ -0,0 +1,275 @@
+"""
+Streaming Sorting module for InnoSortRecycle Digital Twin.
+This module runs RADORDENA-SORT-01 headless against a continuous conveyor feed:
+spectra are buffered in a preallocated ring, classified in micro-batches and
+turned into pneumatic diverter commands with latency accounting.
+"""
+import queue
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from src.ai_engine import HyperspectralClassifier, ROUTE_LABELS
+
+REJECT_ROUTE = 2  # Bin C (Reject) - fail-safe when the diverter window is missed
+
+# One micro-batch of diverter commands; every field is an array of equal length.
+DiverterBatch = namedtuple('DiverterBatch', [
+    'object_ids', 'route_ids', 'class_codes', 'confidences',
+    'arrival_s', 'decision_s', 'latency_s', 'late'
+])
+
+
+def iter_commands(batch):
+    """Expands a DiverterBatch into (object_id, route, latency_s) tuples for actuators."""
+    for obj_id, route_id, latency in zip(batch.object_ids, batch.route_ids, batch.latency_s):
+        yield int(obj_id), ROUTE_LABELS[route_id], float(latency)
+
+
+class SpectraRingBuffer:
+    """
+    Fixed-capacity FIFO of spectra backed by one preallocated NumPy block.
+    Never allocates after construction; push refuses new objects when full.
+    """
+
+    def __init__(self, capacity, n_bands, dtype=np.float32):
+        self.capacity = int(capacity)
+        self.spectra = np.empty((self.capacity, n_bands), dtype=dtype)
+        self.arrival_s = np.empty(self.capacity, dtype=np.float64)
+        self.object_ids = np.empty(self.capacity, dtype=np.int64)
+        self._head = 0  # Next slot to read
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def free(self):
+        """Number of slots still available."""
+        return self.capacity - self._count
+
+    def oldest_arrival(self):
+        """Arrival timestamp of the object waiting longest (None when empty)."""
+        if self._count == 0:
+            return None
+        return self.arrival_s[self._head]
+
+    def push(self, spectra, arrival_s, object_ids):
+        """
+        Copies as many rows of an (k, bands) block as fit.
+        Returns: number of rows accepted (less than k means backpressure).
+        """
+        n = min(len(spectra), self.free)
+        tail = (self._head + self._count) % self.capacity
+        first = min(n, self.capacity - tail)
+
+        self.spectra[tail:tail + first] = spectra[:first]
+        self.arrival_s[tail:tail + first] = arrival_s[:first]
+        self.object_ids[tail:tail + first] = object_ids[:first]
+        if n > first:  # Wrap around to the start of the block
+            rest = n - first
+            self.spectra[:rest] = spectra[first:n]
+            self.arrival_s[:rest] = arrival_s[first:n]
+            self.object_ids[:rest] = object_ids[first:n]
+
+        self._count += n
+        return n
+
+    def pop(self, max_items):
+        """
+        Removes up to max_items of the oldest rows and returns zero-copy views
+        (spectra, arrival_s, object_ids). A batch never crosses the wrap point,
+        so the views stay contiguous; the remainder comes out on the next pop.
+        Views are only valid until the slots are overwritten by later pushes.
+        """
+        n = min(max_items, self._count, self.capacity - self._head)
+        start = self._head
+        self._head = (self._head + n) % self.capacity
+        self._count -= n
+        return (self.spectra[start:start + n],
+                self.arrival_s[start:start + n],
+                self.object_ids[start:start + n])
+
+
+class ConveyorSortingEngine:
+    """
+    RADORDENA-SORT-01 Streaming Mode: continuous conveyor operation.
+    Objects are classified in micro-batches of up to batch_size, or earlier once
+    the oldest waiting object has used flush_fraction of its latency budget.
+    Objects decided after max_latency_s are routed to Bin C (Reject).
+    clock must return monotonic wall-clock seconds (e.g. time.perf_counter):
+    run() sleeps in real time until the next flush deadline it computes.
+    """
+
+    def __init__(self, classifier=None, capacity=4096, batch_size=256,
+                 max_latency_s=0.050, flush_fraction=0.5, clock=time.perf_counter):
+        self.classifier = classifier or HyperspectralClassifier()
+        self.buffer = SpectraRingBuffer(capacity, len(self.classifier.wavelengths))
+        self.batch_size = int(batch_size)
+        self.max_latency_s = float(max_latency_s)
+        self.flush_after_s = self.max_latency_s * float(flush_fraction)
+        self.clock = clock
+
+        self._next_id = 0
+        self.stats = {
+            'objects_in': 0,
+            'objects_sorted': 0,
+            'late_rejects': 0,
+            'backpressure_events': 0,
+            'batches': 0
+        }
+
+    def submit(self, spectra, arrival_s=None):
+        """
+        Queues one spectrum or an (k, bands) frame of spectra.
+
+        Returns:
+            int: Number of objects accepted. Fewer than offered means the
+                buffer is full and the caller must poll() before retrying.
+        """
+        spectra = np.asarray(spectra)
+        if spectra.ndim == 1:
+            spectra = spectra[np.newaxis, :]
+        if arrival_s is None:
+            arrival_s = self.clock()
+        arrival = np.broadcast_to(np.asarray(arrival_s, dtype=np.float64), (len(spectra),))
+        ids = np.arange(self._next_id, self._next_id + len(spectra), dtype=np.int64)
+
+        accepted = self.buffer.push(spectra, arrival, ids)
+        self._next_id += accepted
+        self.stats['objects_in'] += accepted
+        if accepted < len(spectra):
+            self.stats['backpressure_events'] += 1
+        return accepted
+
+    def due(self):
+        """True when a micro-batch should be classified now."""
+        if len(self.buffer) >= self.batch_size:
+            return True
+        oldest = self.buffer.oldest_arrival()
+        return oldest is not None and self.clock() - oldest >= self.flush_after_s
+
+    def poll(self, force=False):
+        """
+        Classifies one micro-batch if due (or forced).
+        Returns: DiverterBatch, or None when nothing was classified.
+        """
+        if len(self.buffer) == 0 or not (force or self.due()):
+            return None
+
+        spectra, arrival_s, object_ids = self.buffer.pop(self.batch_size)
+        class_codes, confidences, route_ids = self.classifier.classify_batch(spectra)
+
+        decision_s = self.clock()
+        latency_s = decision_s - arrival_s
+        late = latency_s > self.max_latency_s
+        route_ids = np.where(late, REJECT_ROUTE, route_ids).astype(np.int8)
+
+        self.stats['batches'] += 1
+        self.stats['objects_sorted'] += len(object_ids)
+        self.stats['late_rejects'] += int(late.sum())
+
+        return DiverterBatch(object_ids.copy(), route_ids, class_codes, confidences,
+                             arrival_s.copy(), np.full(len(object_ids), decision_s),
+                             latency_s, late)
+
+    def drain(self):
+        """Classifies everything still buffered (end of shift / end of stream)."""
+        while len(self.buffer):
+            yield self.poll(force=True)
+
+    def _time_to_flush(self):
+        """Seconds until the oldest buffered object is due (None when the ring is empty)."""
+        oldest = self.buffer.oldest_arrival()
+        if oldest is None:
+            return None
+        return max(0.0, oldest + self.flush_after_s - self.clock())
+
+    def run(self, source):
+        """
+        Pulls spectra (or (k, bands) frames) from any iterable and yields
+        DiverterBatch results. The source is read on a helper thread and only
+        advanced once the previous item is in the ring, so a slow classifier
+        throttles the feed instead of dropping objects (and sources that reuse
+        a receive buffer stay valid). While the source is blocked, buffered
+        objects are still flushed on their latency deadline, measured with
+        self.clock (real seconds; see the class docstring).
+        """
+        items = queue.Queue()
+        resume = threading.Semaphore(0)
+        stop = threading.Event()
+
+        def reader():
+            try:
+                for item in source:
+                    items.put((True, item))
+                    resume.acquire()
+                    if stop.is_set():
+                        return
+                items.put((False, None))
+            except Exception as error:  # pylint: disable=broad-except
+                items.put((False, error))
+
+        threading.Thread(target=reader, name="spectra-source", daemon=True).start()
+        try:
+            while True:
+                try:
+                    has_item, item = items.get(timeout=self._time_to_flush())
+                except queue.Empty:
+                    # Source paused: flush objects whose latency budget is running out
+                    batch = self.poll()
+                    if batch is not None:
+                        yield batch
+                    continue
+                if not has_item:
+                    if item is not None:
+                        raise item
+                    break
+
+                item = np.asarray(item)
+                if item.ndim == 1:
+                    item = item[np.newaxis, :]
+
+                arrival_s = self.clock()
+                offset = 0
+                while offset < len(item):
+                    offset += self.submit(item[offset:], arrival_s)
+                    # Backpressure: classify until there is room for the rest
+                    while offset < len(item) and self.buffer.free == 0:
+                        yield self.poll(force=True)
+                resume.release()
+
+                batch = self.poll()
+                while batch is not None:
+                    yield batch
+                    batch = self.poll()
+        finally:
+            # Let the reader thread exit if the consumer stops early
+            stop.set()
+            resume.release()
+
+        yield from self.drain()
+
+
+def socket_spectra_source(sock, n_bands, dtype=np.float32):
+    """
+    Reads fixed-size spectra frames from a connected stream socket until EOF.
+    Each yielded array is a view on a reused receive buffer, valid until the
+    next iteration (ConveyorSortingEngine copies it into its ring on submit).
+    """
+    frame = bytearray(n_bands * np.dtype(dtype).itemsize)
+    view = memoryview(frame)
+    spectrum = np.frombuffer(frame, dtype=dtype)
+
+    while True:
+        received = 0
+        while received < len(frame):
+            n = sock.recv_into(view[received:])
+            if n == 0:
+                if received:
+                    raise ConnectionError("Socket closed mid-frame")
+                return
+            received += n
+        yield spectrum
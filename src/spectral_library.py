@@ -0,0 +1,138 @@
+"""
+Spectral Library module for InnoSortRecycle Digital Twin.
+This module holds the reference signature library (NMC, LFP, LCO and contaminants)
+and matches incoming spectra against it by cosine / Spectral Angle Mapper (SAM)
+similarity. All references live in one unit-normalized matrix, so matching a
+batch is a single GEMM regardless of how many chemistries are registered.
+"""
+import numpy as np
+
+from src.ai_engine import HyperspectralClassifier
+
+METRICS = ('cosine', 'sam')
+
+
+def _normalize_rows(block):
+    """Unit-length rows in float32; all-zero rows stay zero instead of turning into NaN."""
+    block = np.asarray(block, dtype=np.float32)
+    norms = np.linalg.norm(block, axis=-1, keepdims=True)
+    return block / np.where(norms > 0, norms, 1.0).astype(np.float32)
+
+
+class SpectralLibrary:
+    """
+    Reference signatures for one wavelength grid, stored as a (K, bands)
+    unit-normalized matrix with a parallel list of names.
+    """
+
+    def __init__(self, wavelengths):
+        self.wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        self.names = []
+        self._references = np.empty((0, len(self.wavelengths)), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    @property
+    def references(self):
+        """(K, bands) unit-normalized reference matrix (read-only view)."""
+        view = self._references.view()
+        view.setflags(write=False)
+        return view
+
+    def add(self, name, signature):
+        """Registers (or replaces) a reference signature."""
+        signature = np.asarray(signature, dtype=np.float64)
+        if signature.shape != self.wavelengths.shape:
+            raise ValueError(f"Signature for '{name}' has {signature.size} bands, "
+                             f"library grid has {self.wavelengths.size}")
+
+        row = _normalize_rows(signature[np.newaxis, :])
+        if name in self.names:
+            self._references[self.names.index(name)] = row[0]
+        else:
+            self.names.append(name)
+            self._references = np.vstack([self._references, row])
+
+    def remove(self, name):
+        """Drops a reference signature."""
+        index = self.names.index(name)
+        del self.names[index]
+        self._references = np.delete(self._references, index, axis=0)
+
+    def similarity(self, spectra, metric='cosine'):
+        """
+        Full (N, K) score matrix against every reference.
+        cosine: higher is closer. sam: spectral angle in radians, lower is closer.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+        spectra = np.asarray(spectra)
+        if spectra.ndim == 1:
+            spectra = spectra[np.newaxis, :]
+
+        scores = _normalize_rows(spectra) @ self._references.T
+        if metric == 'sam':
+            scores = np.arccos(np.clip(scores, -1.0, 1.0))
+        return scores
+
+    def match(self, spectra, k=1, metric='cosine'):
+        """
+        Top-k library matches for a spectrum or an (N, bands) block.
+
+        Returns:
+            tuple: ((N, k) reference indices, (N, k) scores), best match first.
+                Decode indices with labels().
+        """
+        if not self.names:
+            raise ValueError("Spectral library is empty")
+        return self.rank(self.similarity(spectra, metric), k, metric)
+
+    def rank(self, scores, k=1, metric='cosine'):
+        """
+        Top-k selection on a precomputed (N, K) score matrix, e.g. cosine
+        scores from compressed codes. Returns (indices, scores) like match().
+        """
+        k = min(int(k), len(self.names))
+        # SAM ranks ascending, cosine descending; rank on a "larger is better" key
+        key = -scores if metric == 'sam' else scores
+
+        if k < len(self.names):
+            top = np.argpartition(-key, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(k), (len(key), k))
+        top_key = np.take_along_axis(key, top, axis=1)
+        order = np.argsort(-top_key, axis=1, kind='stable')
+
+        indices = np.take_along_axis(top, order, axis=1)
+        return indices, np.take_along_axis(scores, indices, axis=1)
+
+    def labels(self, indices):
+        """Reference names for an index array returned by match()."""
+        return np.asarray(self.names, dtype=object)[indices]
+
+
+def contaminant_signatures(wavelengths):
+    """
+    Reference curves for the non-battery feed seen on the sorting line.
+    Plastic: bright, flat casing with the C-H overtone dip near 930 nm.
+    Metal_Scrap: low, featureless reflectance rising slowly into the NIR.
+    """
+    wavelengths = np.asarray(wavelengths, dtype=np.float64)
+    plastic = 0.55 - 0.15 * np.exp(-((wavelengths - 930)**2)/400)
+    metal_scrap = 0.08 + 0.1 * (wavelengths - wavelengths[0]) / np.ptp(wavelengths)
+    return {'Plastic': plastic, 'Metal_Scrap': metal_scrap}
+
+
+def default_library(classifier=None):
+    """Library seeded with the NMC/LFP/LCO templates and the contaminant references."""
+    classifier = classifier or HyperspectralClassifier()
+    library = SpectralLibrary(classifier.wavelengths)
+    for chemistry in ('NMC', 'LFP', 'LCO'):
+        library.add(chemistry, classifier.spectral_template(chemistry))
+    for name, signature in contaminant_signatures(classifier.wavelengths).items():
+        library.add(name, signature)
+    return library
@@ -0,0 +1,210 @@
+"""
+Telemetry Store module for InnoSortRecycle Digital Twin.
+This module persists RADORDENA-BIO-01 sensor history (pH, temperature, DO and
+bacterial load per tank) as an append-only columnar store: fixed-size chunks
+of one .npy file per column plus a JSON manifest of each chunk's time range.
+Reads memory-map only the chunks a query overlaps, so months of history can be
+sliced or downsampled without loading it into RAM.
+"""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+TELEMETRY_SIGNALS = ('ph', 'temp', 'do', 'bacteria')
+MANIFEST_NAME = "manifest.json"
+
+# column -> on-disk dtype; time is in hours on the plant clock (as ReactorFleet.clock_h)
+TELEMETRY_COLUMNS = {
+    'time_h': np.float64,
+    'tank': np.int32,
+    'ph': np.float32,
+    'temp': np.float32,
+    'do': np.float32,
+    'bacteria': np.float64,
+}
+
+
+class TelemetryStore:
+    """
+    Append-only sensor history under one directory.
+    Rows are buffered in memory and written as a chunk every chunk_rows rows,
+    once the buffer spans flush_every_h hours of plant time (bounding what a
+    crash can lose), or on flush. Queries see buffered rows too. Time must be
+    non-decreasing across appends so every chunk is sorted and time ranges are
+    resolved with a binary search.
+    """
+
+    def __init__(self, root, chunk_rows=1_000_000, flush_every_h=24.0):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.chunk_rows = int(chunk_rows)
+        self.flush_every_h = flush_every_h
+
+        manifest_path = self.root / MANIFEST_NAME
+        if manifest_path.exists():
+            with open(manifest_path, encoding="utf-8") as handle:
+                self.manifest = json.load(handle)
+        else:
+            self.manifest = {'columns': list(TELEMETRY_COLUMNS), 'chunks': []}
+
+        self._buffer = {name: [] for name in TELEMETRY_COLUMNS}
+        self._buffered_rows = 0
+        chunks = self.manifest['chunks']
+        self._last_time = chunks[-1]['t_end'] if chunks else -np.inf
+
+    def __len__(self):
+        return sum(chunk['rows'] for chunk in self.manifest['chunks']) + self._buffered_rows
+
+    @property
+    def n_tanks(self):
+        """Highest tank id seen plus one."""
+        tanks = [chunk['max_tank'] for chunk in self.manifest['chunks']]
+        if self._buffered_rows:
+            tanks.append(int(max(part.max() for part in self._buffer['tank'])))
+        return max(tanks) + 1 if tanks else 0
+
+    def append(self, time_h, tanks, **signals):
+        """
+        Appends one reading per tank, e.g. append(fleet.clock_h, np.arange(n),
+        ph=fleet.ph, temp=fleet.temp, do=do, bacteria=load).
+        time_h may be a scalar or one value per row; every signal is required.
+        """
+        missing = set(TELEMETRY_SIGNALS) - set(signals)
+        if missing:
+            raise ValueError(f"Missing telemetry signals: {sorted(missing)}")
+        columns = np.broadcast_arrays(np.asarray(time_h, dtype=np.float64),
+                                      np.asarray(tanks),
+                                      *[np.asarray(signals[s]) for s in TELEMETRY_SIGNALS])
+        rows = dict(zip(TELEMETRY_COLUMNS, [np.atleast_1d(c) for c in columns]))
+
+        times = rows['time_h']
+        if times.size == 0:
+            return
+        if times[0] < self._last_time or np.any(np.diff(times) < 0):
+            raise ValueError("Telemetry is append-only: time must be non-decreasing")
+        self._last_time = times[-1]
+
+        for name, dtype in TELEMETRY_COLUMNS.items():
+            self._buffer[name].append(rows[name].astype(dtype))
+        self._buffered_rows += len(times)
+        while self._buffered_rows >= self.chunk_rows:
+            self._write_chunk(self.chunk_rows)
+        if (self._buffered_rows and self.flush_every_h is not None
+                and times[-1] - self._buffer['time_h'][0][0] >= self.flush_every_h):
+            self.flush()
+
+    def flush(self):
+        """Writes any buffered rows as a (possibly short) chunk."""
+        if self._buffered_rows:
+            self._write_chunk(self._buffered_rows)
+
+    def _write_chunk(self, n_rows):
+        merged = {name: np.concatenate(parts) for name, parts in self._buffer.items()}
+        index = len(self.manifest['chunks'])
+        for name, values in merged.items():
+            np.save(self.root / f"chunk_{index:06d}_{name}.npy", values[:n_rows])
+            self._buffer[name] = [values[n_rows:]] if len(values) > n_rows else []
+        self._buffered_rows -= n_rows
+
+        self.manifest['chunks'].append({
+            'index': index,
+            'rows': n_rows,
+            't_start': float(merged['time_h'][0]),
+            't_end': float(merged['time_h'][n_rows - 1]),
+            'max_tank': int(merged['tank'][:n_rows].max()),
+        })
+        # Manifest is replaced atomically so readers never see a partial chunk list
+        temp_path = self.root / (MANIFEST_NAME + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(self.manifest, handle, indent=2)
+        os.replace(temp_path, self.root / MANIFEST_NAME)
+
+    def _column(self, chunk, name):
+        """Memory-mapped view of one column of one chunk."""
+        return np.load(self.root / f"chunk_{chunk['index']:06d}_{name}.npy", mmap_mode='r')
+
+    def _buffered(self):
+        """Unflushed rows as one array per column (parts are merged in place)."""
+        for name, parts in self._buffer.items():
+            if len(parts) > 1:
+                self._buffer[name] = [np.concatenate(parts)]
+        return {name: parts[0] for name, parts in self._buffer.items()}
+
+    def iter_range(self, t_start, t_end, columns=TELEMETRY_COLUMNS):
+        """
+        Yields {column: array} slices with t_start <= time_h < t_end: first the
+        flushed chunks (memory-mapped views), then any still-buffered rows.
+        """
+        for chunk in self.manifest['chunks']:
+            if chunk['t_end'] < t_start or chunk['t_start'] >= t_end:
+                continue
+            times = self._column(chunk, 'time_h')
+            lo, hi = np.searchsorted(times, [t_start, t_end], side='left')
+            if hi > lo:
+                yield {name: self._column(chunk, name)[lo:hi] for name in columns}
+
+        if self._buffered_rows:
+            buffered = self._buffered()
+            lo, hi = np.searchsorted(buffered['time_h'], [t_start, t_end], side='left')
+            if hi > lo:
+                yield {name: buffered[name][lo:hi] for name in columns}
+
+    def query(self, t_start, t_end, tanks=None, signals=TELEMETRY_SIGNALS):
+        """
+        Raw readings in [t_start, t_end), optionally for a subset of tanks.
+
+        Returns:
+            dict: 'time_h', 'tank' and each requested signal as 1-D arrays.
+        """
+        columns = ('time_h', 'tank') + tuple(signals)
+        parts = {name: [] for name in columns}
+        for block in self.iter_range(t_start, t_end, columns):
+            keep = slice(None) if tanks is None else np.isin(block['tank'], tanks)
+            for name in columns:
+                parts[name].append(np.asarray(block[name][keep]))
+        return {name: np.concatenate(values) if values
+                else np.empty(0, dtype=TELEMETRY_COLUMNS[name])
+                for name, values in parts.items()}
+
+    def downsample(self, signal, t_start, t_end, bucket_h, n_tanks=None):
+        """
+        Per-tank min/max/mean of one signal in fixed time buckets, accumulated
+        chunk by chunk so only one chunk's slice is resident at a time.
+
+        Returns:
+            dict: 'bucket_start_h' (B,), and 'min' / 'max' / 'mean' / 'count'
+                (n_tanks, B) arrays; empty buckets are NaN (count 0).
+        """
+        n_tanks = self.n_tanks if n_tanks is None else int(n_tanks)
+        n_buckets = int(np.ceil((t_end - t_start) / bucket_h))
+        size = n_tanks * n_buckets
+        total = np.zeros(size)
+        count = np.zeros(size, dtype=np.int64)
+        low = np.full(size, np.inf)
+        high = np.full(size, -np.inf)
+
+        for block in self.iter_range(t_start, t_end, ('time_h', 'tank', signal)):
+            tank = np.asarray(block['tank'], dtype=np.int64)
+            keep = tank < n_tanks
+            bucket = ((np.asarray(block['time_h'])[keep] - t_start) // bucket_h).astype(np.int64)
+            key = tank[keep] * n_buckets + bucket
+            values = np.asarray(block[signal], dtype=np.float64)[keep]
+            total += np.bincount(key, weights=values, minlength=size)
+            count += np.bincount(key, minlength=size)
+            np.minimum.at(low, key, values)
+            np.maximum.at(high, key, values)
+
+        empty = count == 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = total / count
+        low[empty] = high[empty] = mean[empty] = np.nan
+        shape = (n_tanks, n_buckets)
+        return {
+            'bucket_start_h': t_start + bucket_h * np.arange(n_buckets),
+            'min': low.reshape(shape),
+            'max': high.reshape(shape),
+            'mean': mean.reshape(shape),
+            'count': count.reshape(shape),
+        }
@@ -4,17 +4,35 @@ Comprehensive validation of all modules for Chempreneur 2026 demonstration
 """
 
 import sys
+import tempfile
 import time
 from pathlib import Path
 import py_compile
 import streamlit  # pylint: disable=unused-import
-import numpy  # pylint: disable=unused-import
+import numpy as np
 import pandas  # pylint: disable=unused-import
 import plotly  # pylint: disable=unused-import
-from src.simulation_engine import BioleachingReactor, ElectroRecovery  # pylint: disable=unused-import
-from src.ai_engine import HyperspectralClassifier  # pylint: disable=unused-import
-from src.financials import FinancialModel  # pylint: disable=unused-import
+from src.simulation_engine import (BioleachingReactor, ElectroRecovery, sweep_kinetics,
+                                   BLACK_MASS_METALS, CASE_STUDY_COMPOSITION,
+                                   CASE_STUDY_COMPOSITION_VECTOR)
+from src.reactor_kinetics import BioleachingKinetics
+from src.monte_carlo import RecoveryMonteCarlo
+from src.fleet_simulator import ReactorFleet
+from src.health_rules import HealthRuleEngine, LIFE_SUPPORT_RULES
+from src.do_forecaster import DOCrashForecaster
+from src.telemetry_store import TelemetryStore
+from src.ai_engine import (HyperspectralClassifier, CLASS_LABELS, ROUTE_LABELS,
+                           SpectralPCACompressor, get_feature_extractor)
+from src.financials import FinancialModel
+from src.dcf import DiscountedCashFlow, irr, npv
+from src.price_paths import PricePathSimulator, value_at_risk
+from src.sensitivity import SensitivityAnalysis
+from src.plant_pipeline import PlantEconomicsPipeline
 from src.connect_agent import ConnectAgent  # pylint: disable=unused-import
+from src.sorting_stream import ConveyorSortingEngine, REJECT_ROUTE
+from src.parallel_sorting import SharedMemorySorter
+from src.hsi_reader import HyperspectralCube
+from src.spectral_library import default_library
 
 # Test configuration
 
@@ -295,6 +313,885 @@ def test_documentation_completeness():
         return False
 
 
+def test_batch_classification():
+    """Test 11: Vectorized sorter decisions match the per-object path"""
+    try:
+        classifier = HyperspectralClassifier()
+        feed = ['NMC', 'LFP', 'Noise'] * 40
+        spectra = np.stack([classifier.generate_synthetic_spectra(chem)
+                            for chem in feed])
+
+        codes, confidences, routes = classifier.classify_batch(spectra)
+
+        for i, spectrum in enumerate(spectra):
+            expected = classifier.classify_sample(spectrum)
+            observed = (CLASS_LABELS[codes[i]], confidences[i],
+                        ROUTE_LABELS[routes[i]])
+            assert observed == expected, f"Object {i}: {observed} != {expected}"
+
+        log_test("Batch Classification", "PASS",
+                 f"{len(feed)} objects matched scalar decision matrix")
+        return True
+    except AssertionError as e:
+        log_test("Batch Classification", "FAIL", str(e))
+        return False
+
+
+def test_feature_table():
+    """Test 12: Band-index tables are cached per wavelength grid"""
+    try:
+        default_grid = np.linspace(400, 1000, 300)
+        table = get_feature_extractor(default_grid)
+
+        assert table is HyperspectralClassifier().features, "Default table not shared"
+        assert table.band_500 == np.abs(default_grid - 500).argmin(), "500 nm band mismatch"
+        assert table.band_600 == np.abs(default_grid - 600).argmin(), "600 nm band mismatch"
+        assert table.nir_slice == slice(250, 300), "NIR window is not the last 50 bands"
+
+        sensor_grid = np.linspace(350, 1100, 224)
+        sensor_table = get_feature_extractor(sensor_grid)
+        assert sensor_table is not table, "Custom grid reused default table"
+        assert sensor_table is get_feature_extractor(sensor_grid.copy()), \
+            "Custom grid table not cached"
+
+        # Grids short of 900 nm keep classifying, screening the last 50 bands
+        short = HyperspectralClassifier(np.linspace(400, 850, 200))
+        assert short.features.nir_slice == slice(150, 200), "Short grid fallback window wrong"
+        assert short.classify_sample(short.generate_synthetic_spectra('NMC'))[0] == 'NMC'
+
+        # A descending grid resolves the same physical bands as its ascending twin
+        spectra, _ = HyperspectralClassifier().generate_synthetic_batch(
+            ['NMC', 'LFP'], 64, rng=np.random.default_rng(79))
+        descending = HyperspectralClassifier(default_grid[::-1])
+        assert np.array_equal(descending.classify_batch(spectra[:, ::-1])[2],
+                              HyperspectralClassifier().classify_batch(spectra)[2])
+        assert np.allclose(descending.screen_anomalies(spectra[:, ::-1]).integrity_index,
+                           HyperspectralClassifier().screen_anomalies(spectra).integrity_index)
+
+        log_test("Spectral Feature Table", "PASS",
+                 f"Bands 500/600 nm -> {table.band_500}/{table.band_600}")
+        return True
+    except AssertionError as e:
+        log_test("Spectral Feature Table", "FAIL", str(e))
+        return False
+
+
+def test_synthetic_batch():
+    """Test 13: Seeded bulk spectra generation"""
+    try:
+        classifier = HyperspectralClassifier()
+        spectra, labels = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP'], 2000, rng=np.random.default_rng(7))
+        repeat, _ = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP'], 2000, rng=np.random.default_rng(7))
+
+        assert spectra.shape == (2000, 300), "Unexpected block shape"
+        assert spectra.dtype == np.float32, "Block is not float32"
+        assert np.array_equal(spectra, repeat), "Seeded generation not reproducible"
+        assert classifier.spectral_template('NMC') is classifier.spectral_template('NMC'), \
+            "Templates are rebuilt per call"
+
+        _, _, routes = classifier.classify_batch(spectra)
+        expected_routes = np.where(labels == 'NMC', 0, 1)
+        accuracy = np.mean(routes == expected_routes)
+        assert accuracy > 0.99, f"Routing accuracy {accuracy:.3f} on clean feed"
+
+        log_test("Synthetic Batch Generation", "PASS",
+                 f"2000 spectra routed with {accuracy*100:.1f}% accuracy")
+        return True
+    except AssertionError as e:
+        log_test("Synthetic Batch Generation", "FAIL", str(e))
+        return False
+
+
+def test_streaming_sorter():
+    """Test 14: Conveyor streaming engine with bounded ring buffer"""
+    try:
+        classifier = HyperspectralClassifier()
+        spectra, _ = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP', 'Plastic'], 3000, rng=np.random.default_rng(3))
+
+        # Frames larger than the ring force backpressure
+        engine = ConveyorSortingEngine(classifier, capacity=256, batch_size=64,
+                                       max_latency_s=60.0)
+        batches = list(engine.run([spectra[:1800], spectra[1800:]]))
+
+        object_ids = np.concatenate([b.object_ids for b in batches])
+        routes = np.concatenate([b.route_ids for b in batches])
+        assert np.array_equal(object_ids, np.arange(3000)), "Objects sorted out of order"
+        assert np.array_equal(routes, classifier.classify_batch(spectra)[2]), \
+            "Streaming routes differ from batch classification"
+        assert engine.stats['backpressure_events'] > 0, "Backpressure never engaged"
+
+        # An impossible latency budget must fail safe to Bin C
+        strict = ConveyorSortingEngine(classifier, batch_size=64, max_latency_s=-1.0)
+        late = list(strict.run(spectra[:128]))
+        assert all((b.route_ids == REJECT_ROUTE).all() for b in late), \
+            "Late objects were not rejected"
+
+        log_test("Streaming Sorter", "PASS",
+                 f"{engine.stats['objects_sorted']} objects in {engine.stats['batches']} "
+                 "micro-batches")
+        return True
+    except AssertionError as e:
+        log_test("Streaming Sorter", "FAIL", str(e))
+        return False
+
+
+def test_shared_memory_sorter():
+    """Test 15: Process-pool sorting over shared memory keeps object order"""
+    try:
+        classifier = HyperspectralClassifier()
+        spectra, _ = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP', 'Plastic'], 4000, rng=np.random.default_rng(5))
+        spectra = spectra.astype(np.float32)   # the sorter's shared-block dtype
+
+        with SharedMemorySorter(n_workers=2, capacity=1000, min_slice=500) as sorter:
+            small = sorter.frame(100)
+            small[:] = spectra[:100]
+            parallel = sorter.classify_batch(spectra)   # grows the block under `small`
+            assert np.array_equal(small, spectra[:100]), "Frame lost across growth"
+            frame = sorter.frame(len(spectra))
+
+        for observed, expected in zip(parallel, classifier.classify_batch(spectra)):
+            assert np.array_equal(observed, expected), "Parallel results out of order"
+        assert np.array_equal(frame, spectra), "Frame unreadable after close"
+        assert np.array_equal(small, spectra[:100]), "Old frame unreadable after close"
+
+        log_test("Shared-Memory Sorter", "PASS", "4000 objects across 2 workers")
+        return True
+    except AssertionError as e:
+        log_test("Shared-Memory Sorter", "FAIL", str(e))
+        return False
+
+
+def test_cube_reader():
+    """Test 16: Memory-mapped BSQ/BIL/BIP cube reading"""
+    try:
+        classifier = HyperspectralClassifier()
+        lines, samples = 12, 32
+        spectra, _ = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP', 'Plastic'], lines * samples, rng=np.random.default_rng(11))
+        cube = spectra.reshape(lines, samples, -1)
+        layouts = {'bip': (0, 1, 2), 'bil': (0, 2, 1), 'bsq': (2, 0, 1)}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for interleave, axes in layouts.items():
+                raw_path = Path(tmp_dir) / f"capture_{interleave}.raw"
+                np.ascontiguousarray(cube.transpose(axes)).tofile(raw_path)
+                reader = HyperspectralCube(raw_path, lines, samples, cube.shape[2],
+                                           interleave=interleave)
+
+                for result in reader.classify_lines(classifier):
+                    assert np.shares_memory(reader.line(result.line), reader.data), \
+                        f"{interleave} line view is a copy"
+                    expected = classifier.classify_batch(cube[result.line])
+                    assert np.array_equal(result.route_ids, expected[2]), \
+                        f"{interleave} line {result.line} routed differently"
+                del reader
+
+            # Non-default band count without wavelengths must not fall back to 300 bands
+            npy_path = Path(tmp_dir) / "sensor_224.npy"
+            np.save(npy_path, np.zeros((2, 4, 224), dtype=np.float32))
+            foreign = HyperspectralCube.from_npy(npy_path)
+            try:
+                foreign.make_classifier()
+                raise AssertionError("224-band cube accepted the default 300-band grid")
+            except ValueError:
+                pass
+            try:
+                next(foreign.classify_lines(classifier))
+                raise AssertionError("300-band classifier accepted a 224-band cube")
+            except ValueError:
+                pass
+            sensor = HyperspectralCube.from_npy(npy_path, wavelengths=np.linspace(400, 1000, 224))
+            assert len(list(sensor.classify_lines())) == 2, "Cube with wavelengths not classified"
+            del foreign, sensor
+
+        log_test("HSI Cube Reader", "PASS",
+                 f"{len(layouts)} interleaves x {lines} lines streamed zero-copy")
+        return True
+    except AssertionError as e:
+        log_test("HSI Cube Reader", "FAIL", str(e))
+        return False
+
+
+def test_spectral_library():
+    """Test 17: Library matching by cosine and spectral angle"""
+    try:
+        classifier = HyperspectralClassifier()
+        library = default_library(classifier)
+        spectra, labels = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP', 'LCO'], 1500, rng=np.random.default_rng(13))
+
+        for metric in ('cosine', 'sam'):
+            indices, scores = library.match(spectra, k=3, metric=metric)
+            assert indices.shape == (1500, 3), f"{metric}: wrong top-k shape"
+            ranked = scores if metric == 'sam' else -scores
+            assert np.all(np.diff(ranked, axis=1) >= 0), f"{metric}: top-k not sorted"
+            accuracy = np.mean(library.labels(indices[:, 0]) == labels)
+            assert accuracy > 0.99, f"{metric}: top-1 accuracy {accuracy:.3f}"
+
+        library.add('Test_Chemistry', np.ones(len(classifier.wavelengths)))
+        assert library.references.shape[0] == 6, "Reference matrix not extended"
+
+        log_test("Spectral Library Matching", "PASS",
+                 f"{len(library)} references, top-1 accuracy {accuracy*100:.1f}%")
+        return True
+    except AssertionError as e:
+        log_test("Spectral Library Matching", "FAIL", str(e))
+        return False
+
+
+def test_pca_compression():
+    """Test 18: PCA-compressed archive and compressed-space inference"""
+    try:
+        classifier = HyperspectralClassifier()
+        spectra, _ = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP', 'LCO'], 3000, rng=np.random.default_rng(17))
+        compressor = SpectralPCACompressor(n_components=16).fit(spectra[:1000])
+        codes = compressor.transform(spectra)
+
+        ratio = spectra.astype(np.float64).nbytes / codes.nbytes
+        assert ratio >= 10, f"Archive only {ratio:.1f}x smaller"
+        error = compressor.reconstruction_error(spectra)
+        assert error.mean() < 0.03, f"Mean reconstruction RMSE {error.mean():.4f}"
+
+        routes = compressor.classify(codes, classifier)[2]
+        agreement = np.mean(routes == classifier.classify_batch(spectra)[2])
+        assert agreement > 0.98, f"Compressed routing agreement {agreement:.3f}"
+
+        library = default_library(classifier)
+        compressed_scores = compressor.library_similarity(codes, library)
+        reconstructed_scores = library.similarity(compressor.inverse_transform(codes))
+        assert np.allclose(compressed_scores, reconstructed_scores, atol=1e-4), \
+            "Code-space similarity differs from decompressed similarity"
+
+        log_test("PCA Spectral Compression", "PASS",
+                 f"{ratio:.0f}x smaller, RMSE {error.mean():.4f}, "
+                 f"routing agreement {agreement*100:.1f}%")
+        return True
+    except AssertionError as e:
+        log_test("PCA Spectral Compression", "FAIL", str(e))
+        return False
+
+
+def test_anomaly_screen():
+    """Test 19: Batch thermal-runaway screen matches per-object reasoning"""
+    try:
+        classifier = HyperspectralClassifier()
+        spectra, _ = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP', 'Plastic'], 600, rng=np.random.default_rng(19))
+        screen = classifier.screen_anomalies(spectra)
+
+        for i, spectrum in enumerate(spectra):
+            is_anomaly, reason_chain, action = classifier.detect_anomaly(spectrum)
+            assert screen.is_anomaly[i] == is_anomaly, f"Object {i}: mask mismatch"
+            assert screen.reason_chain(i) == (reason_chain, action), \
+                f"Object {i}: reasoning mismatch"
+
+        explained = screen.explain()
+        assert sorted(explained) == screen.flagged.tolist(), "Explained non-flagged items"
+
+        log_test("Anomaly Screen", "PASS",
+                 f"{len(screen.flagged)}/{len(screen)} routed to cryogenic chamber")
+        return True
+    except AssertionError as e:
+        log_test("Anomaly Screen", "FAIL", str(e))
+        return False
+
+
+def test_reactor_ode_kinetics():
+    """Test 20: Coupled ODE kinetics - RK4 vs stiff solver, iron conservation"""
+    try:
+        rng = np.random.default_rng(23)
+        kinetics = BioleachingKinetics(mu_max=rng.uniform(1.0, 2.0, 200),
+                                       metal_max=rng.uniform(0.85, 0.95, 200))
+        days = np.linspace(0, 10, 21)
+
+        explicit = kinetics.integrate(days, method='rk4')
+        implicit = kinetics.integrate(days, method='BDF')
+        assert explicit.shape == (21, 200, 5), "State matrix has wrong shape"
+        assert np.allclose(explicit, implicit, atol=1e-3), "RK4 and BDF disagree"
+
+        total_iron = explicit[..., 1] + explicit[..., 2]
+        assert np.allclose(total_iron, total_iron[0]), "Fe2+/Fe3+ balance not conserved"
+
+        final = explicit[-1, :, 3]
+        assert np.all(final <= kinetics.params['metal_max'] + 1e-9), "Recovery exceeds cap"
+        assert np.all(final > 0.85 * kinetics.params['metal_max']), "Leaching stalled"
+
+        curve = BioleachingReactor().simulate_kinetics(days, model='ode')
+        assert np.all(np.diff(curve) >= 0), "Reactor ODE curve is not monotonic"
+        day_5 = BioleachingReactor().simulate_kinetics(5.0, model='ode')
+        assert np.ndim(day_5) == 0 and np.isclose(day_5, curve[10]), "Scalar time not accepted"
+
+        try:
+            kinetics.integrate_rk4([0.0, 5.0, 2.0])
+            raise AssertionError("Backwards time points accepted by RK4")
+        except ValueError:
+            pass
+
+        log_test("ODE Reactor Kinetics", "PASS",
+                 f"200 parameter sets, day-10 recovery {final.mean()*100:.1f}% mean")
+        return True
+    except AssertionError as e:
+        log_test("ODE Reactor Kinetics", "FAIL", str(e))
+        return False
+
+
+def test_kinetics_sweep():
+    """Test 21: Broadcast efficiency x residence-time kinetics sweep"""
+    try:
+        efficiencies = np.linspace(0.85, 0.98, 40)
+        residence_times = np.linspace(4.0, 12.0, 25)
+        days = np.linspace(0, 20, 81)
+        recovery, days_to_90 = sweep_kinetics(efficiencies, residence_times, days)
+
+        assert recovery.shape == (40, 25, 81), "Sweep cube has wrong shape"
+        assert days_to_90.shape == (40, 25), "Time-to-target map has wrong shape"
+
+        for i, j in [(0, 0), (20, 12), (39, 24)]:
+            reactor = BioleachingReactor(efficiency=efficiencies[i],
+                                         residence_time_days=residence_times[j])
+            assert np.allclose(recovery[i, j], reactor.simulate_kinetics(days)), \
+                f"Cell ({i}, {j}) differs from scalar reactor"
+            if np.isfinite(days_to_90[i, j]):
+                reached = reactor.simulate_kinetics(np.array([days_to_90[i, j]]))[0]
+                assert abs(reached - 0.90) < 1e-9, f"Cell ({i}, {j}) misses 90% target"
+
+        assert np.all(np.isinf(days_to_90[efficiencies <= 0.90])), \
+            "Unreachable cells must report infinity"
+
+        log_test("Kinetics Design Sweep", "PASS",
+                 f"{recovery.size:,} points, fastest 90% in {days_to_90.min():.2f} days")
+        return True
+    except AssertionError as e:
+        log_test("Kinetics Design Sweep", "FAIL", str(e))
+        return False
+
+
+def test_batched_mass_balance():
+    """Test 22: Columnar mass balance for heterogeneous black-mass lots"""
+    try:
+        reactor = BioleachingReactor()
+        rng = np.random.default_rng(29)
+        compositions = rng.dirichlet(np.ones(5), 500)[:, :4]
+        masses = rng.uniform(50, 2000, 500)
+
+        recovered, acid, water = reactor.mass_balance_batch(compositions, masses)
+        assert recovered.shape == (500, 4), "Recovered metals matrix has wrong shape"
+        assert np.allclose(acid, masses * 0.5) and np.allclose(water, masses * 4.0), \
+            "Reagent columns incorrect"
+
+        single, _ = reactor.mass_balance(masses[0])
+        expected = [masses[0] * CASE_STUDY_COMPOSITION[m] * reactor.efficiency
+                    for m in BLACK_MASS_METALS]
+        assert [single[m] for m in BLACK_MASS_METALS] == expected, \
+            "Dict wrapper diverged from the case-study balance"
+
+        # Array input still broadcasts through the dict wrapper (every lot kept)
+        lots, _ = reactor.mass_balance(np.array([350.0, 700.0]))
+        assert np.allclose(lots['Li'], np.array([25.0, 50.0]) * reactor.efficiency), \
+            "Array input lost lots after the first"
+        assert np.allclose(lots['H2SO4_Consumed'], [175.0, 350.0]), "Array reagents wrong"
+
+        lot = recovered[7]
+        assert np.allclose(lot, masses[7] * compositions[7] * reactor.efficiency), \
+            "Per-lot composition not applied"
+
+        log_test("Batched Mass Balance", "PASS",
+                 f"500 lots, {recovered.sum()/1000:.1f} t metals recovered")
+        return True
+    except AssertionError as e:
+        log_test("Batched Mass Balance", "FAIL", str(e))
+        return False
+
+
+def test_product_conversion_matrix():
+    """Test 23: Matrix-form metal -> salt stoichiometry and configurable routes"""
+    try:
+        reactor = BioleachingReactor()
+        extractor = ElectroRecovery()
+        masses = np.array([350.0, 1000.0, 12.5])
+        recovered, _, _ = reactor.mass_balance_batch(CASE_STUDY_COMPOSITION_VECTOR, masses)
+
+        batch = extractor.calculate_products_batch(recovered, apply_purity=False)
+        for i, mass in enumerate(masses):
+            single = extractor.calculate_products(reactor.mass_balance(mass)[0])
+            assert np.allclose(batch[i], list(single.values()), rtol=1e-12), \
+                f"Lot {i}: matrix conversion differs from dict path"
+
+        # Array-valued dicts broadcast per lot (4 lots: same size as the metal axis)
+        lots = np.append(masses, 700.0)
+        per_lot = extractor.calculate_products(reactor.mass_balance(lots)[0])
+        expected = extractor.calculate_products_batch(
+            reactor.mass_balance_batch(CASE_STUDY_COMPOSITION_VECTOR, lots)[0], apply_purity=False)
+        assert np.allclose(np.column_stack(list(per_lot.values())), expected), \
+            "Dict path mixes lots for array input"
+
+        net = extractor.calculate_products_batch(recovered)
+        assert np.allclose(net, batch * extractor.purity), "Purity not applied"
+
+        pcam = ElectroRecovery(route='pcam_sulfate')
+        assert 'NiSO4.6H2O' in pcam.products, "pCAM route not loaded from config"
+        li_column = pcam.products.index('Li2CO3')
+        assert np.allclose(pcam.calculate_products_batch(recovered)[:, li_column],
+                           net[:, 0]), "Shared Li2CO3 conversion differs between routes"
+
+        log_test("Product Conversion Matrix", "PASS",
+                 f"{len(extractor.products)} salts, routes: hydroxide + pCAM sulfate")
+        return True
+    except AssertionError as e:
+        log_test("Product Conversion Matrix", "FAIL", str(e))
+        return False
+
+
+def test_recovery_monte_carlo():
+    """Test 24: Vectorized Monte Carlo recovery uncertainty"""
+    try:
+        engine = RecoveryMonteCarlo()
+        inline = engine.run(200_000, chunk_size=50_000, seed=31)
+        pooled = engine.run(200_000, chunk_size=50_000, n_workers=2, seed=31)
+
+        assert np.array_equal(inline['recovery'], pooled['recovery']), \
+            "Pool chunks not reproducible"
+        p5, p50, p95 = (inline['Recovery_Fraction'][p] for p in (5, 50, 95))
+        assert 0.0 < p5 < p50 < p95 <= 1.0, "Recovery percentiles not ordered"
+
+        reactor = BioleachingReactor()
+        nominal = reactor.simulate_kinetics(np.array([reactor.residence_time]))[0]
+        assert abs(p50 - nominal) < 0.02, f"Median {p50:.3f} far from nominal {nominal:.3f}"
+
+        for n_samples, chunk_size in ((0, 50_000), (1000, 0)):
+            try:
+                engine.run(n_samples, chunk_size=chunk_size)
+                raise AssertionError(f"run({n_samples}, chunk_size={chunk_size}) accepted")
+            except ValueError:
+                pass
+
+        log_test("Recovery Monte Carlo", "PASS",
+                 f"200k samples, P5/P50/P95 = {p5*100:.1f}/{p50*100:.1f}/{p95*100:.1f}%")
+        return True
+    except AssertionError as e:
+        log_test("Recovery Monte Carlo", "FAIL", str(e))
+        return False
+
+
+def test_reactor_fleet():
+    """Test 25: Struct-of-arrays fleet simulation with feed allocation"""
+    try:
+        fleet = ReactorFleet(200, seed=37)
+        feed_per_hour = 1000.0
+        hours = 60 * 24
+        report = fleet.run(hours=hours, feed_kg_per_h=feed_per_hour)
+
+        fed = feed_per_hour * hours
+        accounted = report['Processed_kg'].sum() + fleet.loaded_kg.sum() + fleet.inventory_kg
+        assert abs(accounted - fed) < 1e-6 * fed, "Black mass not conserved across the fleet"
+        assert report['Batches_Completed'].sum() > 0, "No batches harvested"
+        assert np.allclose(report['Status_Hours'].sum(axis=1), hours), \
+            "Health status hours do not cover the horizon"
+
+        reactor = BioleachingReactor()
+        for tank in range(0, 200, 20):
+            status, _ = reactor.check_health_status(fleet.ph[tank], fleet.temp[tank])
+            assert LIFE_SUPPORT_RULES.statuses[fleet.status[tank]] == status, \
+                f"Tank {tank} status mismatch"
+
+        recovered_t = report['Recovered_kg'].sum() / 1000
+        log_test("Reactor Fleet Simulation", "PASS",
+                 f"200 tanks x 60 days, {report['Batches_Completed'].sum()} batches, "
+                 f"{recovered_t:.1f} t metals")
+        return True
+    except AssertionError as e:
+        log_test("Reactor Fleet Simulation", "FAIL", str(e))
+        return False
+
+
+def test_health_rule_engine():
+    """Test 26: Declarative health rules compiled to NumPy masks"""
+    try:
+        reactor = BioleachingReactor()
+        ph = np.array([1.0, 1.4999, 1.5, 1.8, 2.0, 2.0001, 3.0])
+        temp = np.array([20.0, 24.99, 25.0, 30.0, 35.0, 35.01, 40.0])
+        grid_ph, grid_temp = np.meshgrid(ph, temp, indexing='ij')
+        codes, masks = LIFE_SUPPORT_RULES.evaluate(ph=grid_ph, temp=grid_temp)
+        assert codes.shape == grid_ph.shape, "Status codes lost the telemetry shape"
+
+        for i, j in np.ndindex(codes.shape):
+            expected = reactor.check_health_status(ph[i], temp[j])
+            assert LIFE_SUPPORT_RULES.decode(codes[i, j], masks[i, j]) == expected, \
+                f"Mismatch at pH {ph[i]}, T {temp[j]}"
+
+        cooling = LIFE_SUPPORT_RULES.action_bit("ACTIVATE COOLING SYSTEM")
+        assert np.array_equal((masks & cooling) != 0, grid_temp > 35.0), "Cooling mask wrong"
+
+        custom = HealthRuleEngine(
+            [('oxygen', 'do', '<', 2.0, "CRITICAL: DO Crash", "Boost Aeration")])
+        codes, masks = custom.evaluate(do=np.array([1.0, 5.0]))
+        assert custom.decode(codes[0], masks[0]) == ("CRITICAL: DO Crash", ["Boost Aeration"])
+        assert custom.decode(codes[1], masks[1]) == ("Stable", ["Maintaining Aeration"])
+
+        log_test("Health Rule Engine", "PASS",
+                 f"{codes.size + grid_ph.size} readings match the life-support loop")
+        return True
+    except AssertionError as e:
+        log_test("Health Rule Engine", "FAIL", str(e))
+        return False
+
+
+def test_do_crash_forecaster():
+    """Test 27: Batched DO-crash forecast over the 20-minute horizon"""
+    try:
+        forecaster = DOCrashForecaster()
+        minutes = np.arange(10)
+        do_series = np.array([np.full(10, 6.5), np.full(10, 4.0), 4.0 - 0.05 * minutes])
+        bacteria_series = np.array([np.full(10, 3e7), np.full(10, 2e8),
+                                    8e7 * np.exp(0.05 * minutes)])
+        result = forecaster.forecast(do_series, bacteria_series)
+
+        assert result.projected_do.shape == (3, len(forecaster.times_min)), "Projection shape wrong"
+        assert list(result.boost) == [False, True, True], f"Boost flags wrong: {result.boost}"
+        assert np.isinf(result.time_to_crash_min[0]), "Stable tank should never crash"
+        assert 0 < result.time_to_crash_min[1] <= 20, "Crash time outside the horizon"
+        assert abs(result.growth_rate[2] - 0.05) < 1e-9, "Growth rate not fitted from series"
+
+        # Crash time is where the projection crosses the critical level
+        crossing = np.interp(result.time_to_crash_min[1], result.times_min,
+                             result.projected_do[1])
+        assert abs(crossing - forecaster.params['do_critical']) < 1e-9, \
+            "Crash time not interpolated"
+
+        # Larger load crashes sooner
+        loads = np.logspace(8.3, 9, 50)[:, np.newaxis].repeat(5, axis=1)
+        batch = forecaster.forecast(np.full(loads.shape, 4.0), loads)
+        assert batch.boost.all(), "High loads should all trigger a boost"
+        assert np.all(np.diff(batch.time_to_crash_min) < 0), "Crash time not monotone in load"
+
+        reasoning, action = result.reasoning(1)
+        assert action == "INCREASE AERATION (Pre-emptive)" and len(reasoning) == 4
+        assert set(result.explain()) == {1, 2}, "Explain should cover flagged tanks only"
+
+        log_test("DO Crash Forecaster", "PASS",
+                 f"Crash in {result.time_to_crash_min[1]:.1f} min at 2e8 cells/mL")
+        return True
+    except AssertionError as e:
+        log_test("DO Crash Forecaster", "FAIL", str(e))
+        return False
+
+
+def test_telemetry_store():
+    """Test 28: Append-only chunked telemetry store with downsampling"""
+    try:
+        fleet = ReactorFleet(8, seed=41)
+        tanks = np.arange(fleet.n_tanks)
+        history = []
+        with tempfile.TemporaryDirectory() as root:
+            store = TelemetryStore(root, chunk_rows=100, flush_every_h=None)
+            for _ in range(48):
+                fleet.step()
+                do = np.full(fleet.n_tanks, 5.0) - 0.01 * fleet.clock_h
+                store.append(fleet.clock_h, tanks, ph=fleet.ph, temp=fleet.temp,
+                             do=do, bacteria=5e8)
+                history.append(fleet.temp.astype(np.float32))
+            store.flush()
+            assert len(store) == 48 * 8, "Row count mismatch"
+            assert len(store.manifest['chunks']) == 4, "Rows not split into chunks"
+
+            reopened = TelemetryStore(root)
+            rows = reopened.query(10.0, 20.0, tanks=[3])
+            assert np.array_equal(rows['time_h'], np.arange(10.0, 20.0)), "Time range wrong"
+            assert np.array_equal(rows['temp'], np.array(history)[9:19, 3]), "Readings corrupted"
+
+            summary = reopened.downsample('temp', 1.0, 49.0, bucket_h=12.0)
+            blocks = np.array(history).reshape(4, 12, 8)
+            assert summary['mean'].shape == (8, 4), "Downsample shape wrong"
+            assert np.allclose(summary['mean'], blocks.mean(axis=1).T, atol=1e-4)
+            assert np.allclose(summary['max'], blocks.max(axis=1).T)
+            assert np.all(summary['count'] == 12), "Bucket counts wrong"
+
+            try:
+                reopened.append(1.0, tanks, ph=1.8, temp=30.0, do=5.0, bacteria=5e8)
+                raise AssertionError("Out-of-order append accepted")
+            except ValueError:
+                pass
+
+            # Unflushed rows are queryable; the buffer is flushed every 24 h of plant time
+            live = TelemetryStore(Path(root) / "live")
+            for hour in range(1, 31):
+                live.append(float(hour), tanks, ph=1.8, temp=30.0 + hour, do=5.0, bacteria=5e8)
+            assert len(live.manifest['chunks']) == 1, "Time-based flush did not run"
+            assert live.manifest['chunks'][0]['t_end'] == 25.0, "Flushed at wrong time"
+            rows = live.query(20.0, 31.0, tanks=[0])
+            assert np.array_equal(rows['time_h'], np.arange(20.0, 31.0)), "Buffered rows missing"
+            assert live.downsample('temp', 26.0, 31.0, bucket_h=5.0)['count'].sum() == 5 * 8
+
+        log_test("Telemetry Store", "PASS",
+                 f"{len(store)} readings in {len(store.manifest['chunks'])} chunks")
+        return True
+    except AssertionError as e:
+        log_test("Telemetry Store", "FAIL", str(e))
+        return False
+
+
+def test_cstr_cascade_steady_state():
+    """Test 29: Steady-state CSTR cascade solved without time integration"""
+    try:
+        kinetics = BioleachingKinetics(metal_max=np.linspace(0.85, 0.95, 200))
+        residence = np.array([1.5, 2.0, 2.5])
+        states = kinetics.steady_state_cascade(residence)
+        assert states.shape == (3, 200, 5), f"Unexpected shape {states.shape}"
+
+        # Each tank balances inflow from the previous one against the kinetics
+        inflow = kinetics.initial_state()
+        for tank, tau in enumerate(residence):
+            residual = (inflow - states[tank]) / tau + kinetics.derivatives(states[tank])
+            assert np.abs(residual).max() < 1e-8, f"Tank {tank} not at steady state"
+            inflow = states[tank]
+        assert np.all(np.diff(states[..., 3], axis=0) > 0), "Recovery must rise along the cascade"
+
+        reactor = BioleachingReactor()
+        flows = np.array([2000.0, 5000.0, 50000.0])
+        recovery = reactor.simulate_continuous(flows, n_tanks=3)
+        assert recovery.shape == (3, 3), "Recovery should be (flows, tanks)"
+        assert np.all(np.diff(recovery[:, -1]) < 0), "Higher throughput should lower recovery"
+        assert recovery[0, -1] <= reactor.efficiency, "Recovery exceeds leachable fraction"
+        assert recovery[-1, -1] < 0.2, "Short residence should wash the culture out"
+
+        log_test("CSTR Cascade Steady State", "PASS",
+                 f"3-tank recovery {recovery[0, -1]*100:.1f}% at 2 m3/day")
+        return True
+    except AssertionError as e:
+        log_test("CSTR Cascade Steady State", "FAIL", str(e))
+        return False
+
+
+def test_roi_grid():
+    """Test 30: Vectorized ROI grid over capacities, prices and FX"""
+    try:
+        finance = FinancialModel()
+        masses, _ = BioleachingReactor().mass_balance(350.0)
+        products = ElectroRecovery().calculate_products(masses)
+
+        rng = np.random.default_rng(53)
+        tonnages = np.linspace(100, 20000, 400)
+        prices = finance.price_vector() * rng.lognormal(0.0, 0.25, (50, len(finance.products)))
+        fx_rates = rng.normal(84.0, 3.0, 50)
+        grid = finance.calculate_roi_grid(tonnages[:, np.newaxis], products, prices, fx_rates)
+        assert grid['Gross_Profit'].shape == (400, 50), "Grid did not broadcast"
+
+        for i, j in [(0, 0), (123, 7), (399, 49)]:
+            scenario = FinancialModel()
+            scenario.market_prices_usd = dict(zip(finance.products, prices[j]))
+            scenario.exchange_rate = fx_rates[j]
+            expected = scenario.calculate_roi(tonnages[i], products)
+            for key in ('Annual_Revenue', 'Annual_OpEx', 'Gross_Profit', 'Payback_Years'):
+                assert np.isclose(grid[key][i, j], expected[key], rtol=1e-12), \
+                    f"{key} mismatch at ({i}, {j})"
+
+        base = finance.calculate_roi_grid(5000, products, {'Li2CO3': [0.0, 15000.0]},
+                                          breakdown=True)
+        assert np.isclose(base['Revenue_Breakdown'][1].sum(), base['Annual_Revenue'][1])
+        assert base['Annual_Revenue'][0] < base['Annual_Revenue'][1], "Li price scenario ignored"
+
+        log_test("Vectorized ROI Grid", "PASS",
+                 f"{grid['Gross_Profit'].size} scenarios match calculate_roi")
+        return True
+    except AssertionError as e:
+        log_test("Vectorized ROI Grid", "FAIL", str(e))
+        return False
+
+
+def test_dcf_npv_irr():
+    """Test 31: Multi-year DCF with vectorized NPV / IRR"""
+    try:
+        # Textbook flows: 10% IRR annuity, and a single-period doubling
+        flows = np.array([[-1000.0, 263.797480794, 263.797480794, 263.797480794,
+                           263.797480794, 263.797480794],
+                          [-100.0, 200.0, 0.0, 0.0, 0.0, 0.0],
+                          [-100.0, 10.0, 10.0, 10.0, 10.0, 10.0]])
+        rates = irr(flows)
+        assert abs(rates[0] - 0.10) < 1e-9 and abs(rates[1] - 1.0) < 1e-9, f"IRR wrong: {rates}"
+        assert abs(npv(flows[2], rates[2])) < 1e-6, "Loss-making IRR not a root of NPV"
+        assert np.isnan(irr([[100.0, 50.0, 50.0]]))[0], "No sign change should give NaN"
+
+        dcf = DiscountedCashFlow(plant_life_years=10, ramp_up=(0.5,), degradation=0.0,
+                                 tax_rate=0.0, depreciation_years=5)
+        result = dcf.evaluate(annual_revenue=[300.0, 150.0], annual_opex=100.0, capex=500.0,
+                              discount_rate=0.0)
+        assert np.allclose(result['Cash_Flows'][0], [-500.0, 100.0] + [200.0] * 9)
+        assert np.allclose(result['NPV'], [1400.0, -25.0]), "Undiscounted NPV wrong"
+        assert np.isclose(result['Payback_Years'][0], 3.0), "Payback wrong"
+        assert np.isinf(result['Payback_Years'][1]), "Unrecovered CapEx should never pay back"
+
+        finance = FinancialModel()
+        masses, _ = BioleachingReactor().mass_balance(350.0)
+        products = ElectroRecovery().calculate_products(masses)
+        tonnages = np.linspace(100, 20000, 2000)
+        prices = finance.price_vector() * np.random.default_rng(59).lognormal(0.0, 0.6, (2000, 4))
+        scenarios = DiscountedCashFlow().evaluate_roi(
+            finance.calculate_roi_grid(tonnages, products, prices), tonnages)
+        solved = ~np.isnan(scenarios['IRR'])
+        residual = npv(scenarios['Cash_Flows'][solved], scenarios['IRR'][solved])
+        assert np.all(np.abs(residual) < 1e-6 * np.abs(scenarios['Cash_Flows'][solved]).sum(-1))
+
+        log_test("DCF NPV / IRR", "PASS",
+                 f"{solved.sum()} scenario IRRs solved, "
+                 f"median {np.nanmedian(scenarios['IRR'])*100:.0f}%")
+        return True
+    except AssertionError as e:
+        log_test("DCF NPV / IRR", "FAIL", str(e))
+        return False
+
+
+def test_price_path_simulator():
+    """Test 32: Correlated commodity / FX price paths and revenue VaR"""
+    try:
+        simulator = PricePathSimulator()
+        paths = simulator.simulate(50000, n_months=24, seed=61)
+        assert paths.shape == (50000, 24, 5), f"Unexpected shape {paths.shape}"
+        assert np.all(paths > 0), "Prices must stay positive"
+
+        # GBM factors: annualised volatility, martingale mean and correlation recovered
+        returns = np.diff(np.log(paths), axis=1).reshape(-1, 5)
+        nickel, fx = simulator.factors.index('Ni(OH)2'), simulator.factors.index('USD_INR')
+        assert abs(returns[:, nickel].std() * np.sqrt(12) - 0.25) < 0.005, "Ni volatility off"
+        assert abs(paths[:, -1, nickel].mean() / 16000 - 1.0) < 0.01, "Ni GBM not a martingale"
+        corr = np.corrcoef(returns[:, nickel], returns[:, fx])[0, 1]
+        assert abs(corr + 0.15) < 0.02, f"Ni / FX correlation {corr:.3f}"
+
+        # Li2CO3 reverts: 2-year log-price spread matches the OU stationary formula
+        spread = np.log(paths[:, -1, 0]).std()
+        expected = np.sqrt(0.45 ** 2 / 1.6 * (1 - np.exp(-3.2)))
+        assert abs(spread - expected) < 0.01, "Li2CO3 OU spread off"
+
+        masses, _ = BioleachingReactor().mass_balance(350.0)
+        products = ElectroRecovery().calculate_products(masses)
+        flat = np.broadcast_to(simulator.start_prices, (1, 12, 5))
+        monthly = simulator.monthly_revenue(flat, products, 5000)
+        static = FinancialModel().calculate_roi(5000, products)['Annual_Revenue']
+        assert np.isclose(monthly.sum(), static), "Flat prices should reproduce calculate_roi"
+
+        risk = simulator.revenue_risk(products, 5000, n_paths=20000, seed=67)
+        assert 0 < risk['VaR'] < risk['CVaR'], "CVaR must exceed VaR"
+        assert np.isclose(value_at_risk(np.arange(100.0), 0.9)['VaR'], 49.5 - 9.9)
+
+        log_test("Price Path Simulator", "PASS",
+                 f"95% revenue VaR INR {risk['VaR']/1e7:.1f} Cr, CVaR {risk['CVaR']/1e7:.1f} Cr")
+        return True
+    except AssertionError as e:
+        log_test("Price Path Simulator", "FAIL", str(e))
+        return False
+
+
+def test_sensitivity_analysis():
+    """Test 33: Tornado swings and Sobol indices for unit economics"""
+    try:
+        analysis = SensitivityAnalysis(tonnage_per_year=5000.0)
+        masses, _ = BioleachingReactor().mass_balance(350.0)
+        products = ElectroRecovery().calculate_products(masses)
+        expected = FinancialModel().calculate_roi(5000.0, products)['Gross_Profit']
+        assert np.isclose(analysis.evaluate(analysis.base)[0], expected, rtol=1e-12), \
+            "Base design does not reproduce the dashboard pipeline"
+
+        tornado = {row['Input']: row for row in analysis.one_at_a_time(delta=0.1)}
+        for item, cost in FinancialModel().costs.items():
+            swing = tornado[f"Cost: {item}"]['Swing']
+            assert np.isclose(swing, 2 * 0.1 * cost * 5000.0), f"{item} swing not linear"
+        assert tornado['Efficiency']['High'] > tornado['Efficiency']['Low'], "Efficiency sign wrong"
+
+        table = analysis.ranked_table(n_samples=1024, seed=71)
+        swings = [row['Swing'] for row in table]
+        assert swings == sorted(swings, reverse=True), "Table not ranked"
+        assert [row['Rank'] for row in table] == list(range(1, len(table) + 1))
+        first_order = sum(row['S1'] for row in table)
+        assert 0.95 < first_order < 1.02, f"Near-additive model: sum S1 = {first_order:.3f}"
+        assert all(row['ST'] >= row['S1'] - 0.01 for row in table), "ST below S1"
+
+        log_test("Sensitivity Analysis", "PASS",
+                 f"Top driver: {table[0]['Input']} (ST {table[0]['ST']:.2f})")
+        return True
+    except AssertionError as e:
+        log_test("Sensitivity Analysis", "FAIL", str(e))
+        return False
+
+
+def test_plant_economics_pipeline():
+    """Test 34: Memoized mass balance -> products -> ROI -> DCF pipeline"""
+    try:
+        pipeline = PlantEconomicsPipeline(maxsize=4)
+        result = pipeline.run(5000)
+
+        masses, _ = BioleachingReactor().mass_balance(350.0)
+        products = ElectroRecovery().calculate_products(masses)
+        assert result['Products'] == products, "Products differ from the dashboard chain"
+        assert result['ROI'] == FinancialModel().calculate_roi(5000, products), "ROI differs"
+
+        # Capacity change: only ROI and DCF are recomputed
+        pipeline.run(8000)
+        info = pipeline.cache_info()
+        assert info['mass_balance']['misses'] == 1 and info['products']['misses'] == 1
+        assert info['roi']['misses'] == 2 and info['dcf']['misses'] == 2
+
+        # Repeat is a full hit, and returned dicts do not alias the cache
+        result['ROI']['Gross_Profit'] = 0.0
+        again = pipeline.run(5000)
+        assert again['ROI']['Gross_Profit'] > 0, "Caller mutation leaked into the cache"
+        assert pipeline.cache_info()['roi']['hits'] == 1, "Repeat run missed the cache"
+
+        # Price override only invalidates ROI / DCF; efficiency invalidates everything
+        cheap_li = pipeline.run(5000, prices={'Li2CO3': 7500})
+        assert cheap_li['ROI']['Annual_Revenue'] < again['ROI']['Annual_Revenue']
+        pipeline.run(5000, efficiency=0.85)
+        info = pipeline.cache_info()
+        assert info['mass_balance']['misses'] == 2 and info['products']['misses'] == 2
+
+        for capacity in range(10):
+            pipeline.run(1000 + capacity)
+        assert pipeline.cache_info()['roi']['size'] <= 4, "LRU bound not enforced"
+
+        roi_stage = pipeline.cache_info()['roi']
+        log_test("Plant Economics Pipeline", "PASS",
+                 f"IRR {result['DCF']['IRR']*100:.0f}%, ROI stage "
+                 f"{roi_stage['misses']} misses / {roi_stage['hits'] + roi_stage['misses']} runs")
+        return True
+    except AssertionError as e:
+        log_test("Plant Economics Pipeline", "FAIL", str(e))
+        return False
+
+
+def test_streaming_sorter_paused_source():
+    """Test 35: Streaming engine flushes on deadline while the source is paused"""
+    try:
+        classifier = HyperspectralClassifier()
+        spectra, _ = classifier.generate_synthetic_batch(
+            ['NMC', 'LFP'], 20, rng=np.random.default_rng(73))
+
+        def paused_conveyor():
+            yield from spectra[:10]
+            time.sleep(1.0)  # Belt stops with objects still in the ring
+            yield from spectra[10:]
+
+        # Generous budget (flush at 200 ms) so a loaded runner does not flake
+        engine = ConveyorSortingEngine(classifier, batch_size=64, max_latency_s=0.4)
+        batches = list(engine.run(paused_conveyor()))
+        routes = np.concatenate([b.route_ids for b in batches])
+
+        assert engine.stats['late_rejects'] == 0, \
+            f"{engine.stats['late_rejects']} objects rejected during the pause"
+        assert batches[0].object_ids[-1] == 9, "Pre-pause objects not flushed on their own"
+        assert batches[0].latency_s.max() < 0.5, "Pre-pause objects waited for the next arrival"
+        assert np.array_equal(routes, classifier.classify_batch(spectra)[2]), "Routes changed"
+
+        log_test("Streaming Sorter (Paused Source)", "PASS",
+                 f"Max latency {max(b.latency_s.max() for b in batches)*1e3:.1f} ms across pause")
+        return True
+    except AssertionError as e:
+        log_test("Streaming Sorter (Paused Source)", "FAIL", str(e))
+        return False
+
+
 def run_test_suite():
     """Execute complete test suite"""
     print("\n" + "="*80)
@@ -314,7 +1211,32 @@ def run_test_suite():
         test_market_gaps_coverage,
         test_scoring_criteria,
         stress_test_calculations,
-        test_documentation_completeness
+        test_documentation_completeness,
+        test_batch_classification,
+        test_feature_table,
+        test_synthetic_batch,
+        test_streaming_sorter,
+        test_shared_memory_sorter,
+        test_cube_reader,
+        test_spectral_library,
+        test_pca_compression,
+        test_anomaly_screen,
+        test_reactor_ode_kinetics,
+        test_kinetics_sweep,
+        test_batched_mass_balance,
+        test_product_conversion_matrix,
+        test_recovery_monte_carlo,
+        test_reactor_fleet,
+        test_health_rule_engine,
+        test_do_crash_forecaster,
+        test_telemetry_store,
+        test_cstr_cascade_steady_state,
+        test_roi_grid,
+        test_dcf_npv_irr,
+        test_price_path_simulator,
+        test_sensitivity_analysis,
+        test_plant_economics_pipeline,
+        test_streaming_sorter_paused_source
     ]
 
     for test_func in tests: